@@ -6,6 +6,9 @@ Facilitates safe execution of system-level operations through the AI model
 import json
 import re
 import logging
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Callable, Optional
 from system_controller import SystemController
 from tool_caller import ToolCaller
@@ -14,6 +17,109 @@ from state_manager import StateManager
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Optional SIMD-accelerated JSON parser - falls back to stdlib json
+try:
+    import simdjson
+    _json_parser = simdjson.Parser()
+
+    def _parse_json(text: str) -> Dict[str, Any]:
+        return _json_parser.parse(text).as_dict()
+except ImportError:
+    try:
+        import orjson
+
+        def _parse_json(text: str) -> Dict[str, Any]:
+            return orjson.loads(text)
+    except ImportError:
+        _parse_json = json.loads
+
+
+# Interned status literals shared by every handler result
+_OK = "success"
+_FAIL = "failed"
+
+
+def _result(ok: bool, msg_ok, msg_fail, func: str) -> Dict[str, Any]:
+    """Build a handler result dict.
+
+    Messages may be plain strings or zero-arg callables; callables are
+    only invoked on the branch actually taken, so interpolated messages
+    are not formatted for the untaken branch.
+    """
+    if ok:
+        return {
+            "status": _OK,
+            "message": msg_ok() if callable(msg_ok) else msg_ok,
+            "function": func
+        }
+    return {
+        "status": _FAIL,
+        "message": msg_fail() if callable(msg_fail) else msg_fail,
+        "function": func
+    }
+
+
+# Path separators or an image extension mark the input as a file path,
+# not a color name - one case-insensitive scan instead of three
+_IMAGE_PATH_RE = re.compile(r'[\\/]|\.(?:png|jpe?g|bmp)\Z', re.IGNORECASE)
+
+# Toggle action -> enable flag for the toggle_* handlers; None means flip
+_TOGGLE_MAP = {"on": True, "off": False, "toggle": None}
+
+# Upper bound on how much model output parse_function_call will scan
+_MAX_PARSE_LEN = 65536
+
+@functools.lru_cache(maxsize=128)
+def _extract_function_json(response: str) -> Optional[str]:
+    """Memoized wrapper around _find_json_object for repeated responses"""
+    return _find_json_object(response)
+
+
+# Color name -> hex is pure and has a tiny value set, so memoize it
+_color_to_hex = functools.lru_cache(maxsize=64)(SystemController.convert_color_name_to_hex)
+
+
+def _find_json_object(text: str, marker: str = '"function"') -> Optional[str]:
+    """Find the first balanced JSON object containing the marker.
+
+    Scans forward from each candidate '{' tracking brace depth and string
+    state, so nested objects are handled correctly and stray quotes in
+    the prose around the JSON cannot poison the parse.
+    """
+    search_from = 0
+    while True:
+        start = text.find('{', search_from)
+        if start == -1:
+            return None
+
+        depth = 0
+        in_string = False
+        escape = False
+
+        for i in range(start, len(text)):
+            ch = text[i]
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = in_string
+            elif ch == '"':
+                in_string = not in_string
+            elif not in_string:
+                if ch == '{':
+                    depth += 1
+                elif ch == '}':
+                    depth -= 1
+                    if depth == 0:
+                        candidate = text[start:i + 1]
+                        if marker in candidate:
+                            return candidate
+                        search_from = i + 1
+                        break
+        else:
+            # This candidate never balanced (stray '{' in prose) - the
+            # real object may still start at a later brace
+            search_from = start + 1
+
 
 class FunctionExecutor:
     """Execute system functions requested by the AI model"""
@@ -110,196 +216,251 @@ class FunctionExecutor:
     @staticmethod
     def get_function_definitions() -> str:
         """Get function definitions as formatted string for Ollama"""
-        definitions = "Available Functions:\n"
-        definitions += "================\n\n"
-        
-        for func_name, func_info in FunctionExecutor.AVAILABLE_FUNCTIONS.items():
-            definitions += f"Function: {func_name}\n"
-            definitions += f"Description: {func_info['description']}\n"
-            definitions += f"Parameters: {json.dumps(func_info['params'])}\n"
-            definitions += f"Example: {func_info['example']}\n\n"
-        
-        return definitions
+        return _FUNCTION_DEFS_CACHE
     
     @staticmethod
     def parse_function_call(response: str) -> Dict[str, Any]:
         """Parse function call from model response"""
+        # Bound the work on runaway model output; a legitimate function
+        # call always appears well before this
+        if len(response) > _MAX_PARSE_LEN:
+            response = response[:_MAX_PARSE_LEN]
+
+        # Cheap substring reject before scanning the whole response
+        if '"function"' not in response:
+            return {}
+
         try:
-            # Look for JSON in the response
-            json_match = re.search(r'\{[^{}]*"function"[^{}]*\}', response, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-        except (json.JSONDecodeError, AttributeError):
+            # Locate the first balanced JSON object mentioning "function".
+            # The extraction is memoized so retries of an identical
+            # response skip the scan entirely.
+            json_str = _extract_function_json(response)
+            if json_str:
+                return _parse_json(json_str)
+        except (ValueError, AttributeError):
             pass
-        
+
         return {}
     
+    # ============ Function Handlers ============
+
     @staticmethod
-    def execute_function(function_call: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute a function call and return result"""
-        func_name = function_call.get("function", "")
-        
+    def _handle_set_timer(function_call: Dict[str, Any]) -> Dict[str, Any]:
+        get = function_call.get
+        minutes = int(get("minutes", 0))
+        seconds = int(get("seconds", 0))
+        timer_id = get("timer_id", "default")
+        return SystemController.set_timer(minutes, seconds, timer_id)
+
+    @staticmethod
+    def _handle_get_timer_status(function_call: Dict[str, Any]) -> Dict[str, Any]:
+        timer_id = function_call.get("timer_id", "default")
+        return SystemController.get_timer_status(timer_id)
+
+    @staticmethod
+    def _handle_cancel_timer(function_call: Dict[str, Any]) -> Dict[str, Any]:
+        timer_id = function_call.get("timer_id", "default")
+        return SystemController.cancel_timer(timer_id)
+
+    @staticmethod
+    def _handle_open_application(function_call: Dict[str, Any]) -> Dict[str, Any]:
+        app_name = function_call.get("app_name", "")
+        result = SystemController.open_application(app_name)
+        return _result(
+            result,
+            lambda: f"Application '{app_name}' opened",
+            lambda: f"Could not open '{app_name}'",
+            "open_application"
+        )
+
+    @staticmethod
+    def _handle_toggle_bluetooth(function_call: Dict[str, Any]) -> Dict[str, Any]:
+        action = function_call.get("action", "toggle").lower()
+        if action not in _TOGGLE_MAP:
+            return {
+                "status": "error",
+                "message": f"Unknown action '{action}' - use 'on', 'off', or 'toggle'",
+                "function": "toggle_bluetooth"
+            }
+        result = SystemController.toggle_bluetooth(_TOGGLE_MAP[action])
+        return _result(
+            result,
+            lambda: f"Bluetooth turned {action}",
+            "Could not toggle Bluetooth",
+            "toggle_bluetooth"
+        )
+
+    @staticmethod
+    def _handle_toggle_wifi(function_call: Dict[str, Any]) -> Dict[str, Any]:
+        action = function_call.get("action", "toggle").lower()
+        if action not in _TOGGLE_MAP:
+            return {
+                "status": "error",
+                "message": f"Unknown action '{action}' - use 'on', 'off', or 'toggle'",
+                "function": "toggle_wifi"
+            }
+        result = SystemController.toggle_wifi(_TOGGLE_MAP[action])
+        return _result(
+            result,
+            lambda: f"Wi-Fi turned {action}",
+            "Could not toggle Wi-Fi",
+            "toggle_wifi"
+        )
+
+    @staticmethod
+    def _handle_change_background(function_call: Dict[str, Any]) -> Dict[str, Any]:
+        # Check if it's a file path or color name
+        get = function_call.get
+        background_input = get("color", get("image_path", "blue"))
+
+        # Try to use it as file path first (if it looks like a path)
+        if _IMAGE_PATH_RE.search(background_input):
+            result = SystemController.change_background(image_path=background_input)
+        else:
+            # It's a color name
+            hex_color = _color_to_hex(background_input)
+            result = SystemController.change_background(color=hex_color)
+
+        return _result(
+            result,
+            lambda: f"Background changed to {background_input}",
+            "Could not change background",
+            "change_background"
+        )
+
+    @staticmethod
+    def _handle_set_brightness(function_call: Dict[str, Any]) -> Dict[str, Any]:
+        level = function_call.get("level", 50)
+        result = SystemController.set_brightness(int(level))
+        return _result(
+            result,
+            lambda: f"Brightness set to {level}%",
+            "Could not set brightness",
+            "set_brightness"
+        )
+
+    @staticmethod
+    def _handle_set_volume(function_call: Dict[str, Any]) -> Dict[str, Any]:
+        get = function_call.get
+        level = get("level")
+        level_text = get("level_text")
+        result = SystemController.set_volume(level=level, level_text=level_text)
+        return {
+            "status": result.get("status", "failed"),
+            "message": result.get("message", "Could not set volume"),
+            "volume": result.get("volume"),
+            "function": "set_volume"
+        }
+
+    @staticmethod
+    def _handle_control_volume(function_call: Dict[str, Any]) -> Dict[str, Any]:
+        get = function_call.get
+        action = get("action", "mute").lower()
+        level = get("level")
+        # control_volume always returns a dict, so no type checks needed
+        result = SystemController.control_volume(action, level=level)
+        return {**result, "function": "control_volume"}
+
+    @staticmethod
+    def _handle_lock_screen(function_call: Dict[str, Any]) -> Dict[str, Any]:
+        result = SystemController.lock_screen()
+        return _result(result, "Screen locked", "Could not lock screen", "lock_screen")
+
+    @staticmethod
+    def _handle_sleep_system(function_call: Dict[str, Any]) -> Dict[str, Any]:
+        result = SystemController.sleep_system()
+        return _result(result, "System going to sleep", "Could not put system to sleep", "sleep_system")
+
+    @staticmethod
+    def _handle_shutdown_system(function_call: Dict[str, Any]) -> Dict[str, Any]:
+        result = SystemController.shutdown_system()
+        return _result(result, "System shutting down", "Could not shutdown system", "shutdown_system")
+
+    @staticmethod
+    def _handle_restart_system(function_call: Dict[str, Any]) -> Dict[str, Any]:
+        result = SystemController.restart_system()
+        return _result(result, "System restarting", "Could not restart system", "restart_system")
+
+    @staticmethod
+    def _handle_toggle_airplane_mode(function_call: Dict[str, Any]) -> Dict[str, Any]:
+        action = function_call.get("action", "toggle").lower()
+        if action not in _TOGGLE_MAP:
+            return {
+                "status": "error",
+                "message": f"Unknown action '{action}' - use 'on', 'off', or 'toggle'",
+                "function": "toggle_airplane_mode"
+            }
+        result = SystemController.toggle_airplane_mode(_TOGGLE_MAP[action])
+        return _result(
+            result,
+            lambda: f"Airplane mode turned {action}",
+            "Could not toggle airplane mode",
+            "toggle_airplane_mode"
+        )
+
+    @staticmethod
+    def _handle_open_system_settings(function_call: Dict[str, Any]) -> Dict[str, Any]:
+        setting_type = function_call.get("setting_type", "")
+        result = SystemController.open_system_settings(setting_type)
+        return _result(
+            result,
+            lambda: f"Opened {setting_type} settings",
+            lambda: f"Could not open {setting_type}",
+            "open_system_settings"
+        )
+
+    @staticmethod
+    def _handle_get_system_info(function_call: Dict[str, Any]) -> Dict[str, Any]:
+        info = SystemController.get_system_info_cached()
+        return {
+            "status": "success",
+            "data": info,
+            "function": "get_system_info"
+        }
+
+    # Dispatch table built once at class-definition time - O(1) lookup
+    # instead of a chain of string comparisons per call. The underlying
+    # functions are stored via __func__ because staticmethod descriptors
+    # are only directly callable on Python >= 3.10
+    _HANDLERS: Dict[str, Callable] = {
+        "set_timer": _handle_set_timer.__func__,
+        "get_timer_status": _handle_get_timer_status.__func__,
+        "cancel_timer": _handle_cancel_timer.__func__,
+        "open_application": _handle_open_application.__func__,
+        "toggle_bluetooth": _handle_toggle_bluetooth.__func__,
+        "toggle_wifi": _handle_toggle_wifi.__func__,
+        "change_background": _handle_change_background.__func__,
+        "set_brightness": _handle_set_brightness.__func__,
+        "set_volume": _handle_set_volume.__func__,
+        "control_volume": _handle_control_volume.__func__,
+        "lock_screen": _handle_lock_screen.__func__,
+        "sleep_system": _handle_sleep_system.__func__,
+        "shutdown_system": _handle_shutdown_system.__func__,
+        "restart_system": _handle_restart_system.__func__,
+        "toggle_airplane_mode": _handle_toggle_airplane_mode.__func__,
+        "open_system_settings": _handle_open_system_settings.__func__,
+        "get_system_info": _handle_get_system_info.__func__,
+    }
+
+    @staticmethod
+    def execute_call(func_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a function by name with its parameter dict
+
+        Positional form of execute_function: the handlers only read their
+        own parameters, so callers that already hold the name and params
+        separately can skip building a merged dict per call.
+        """
         try:
-            if func_name == "set_timer":
-                minutes = int(function_call.get("minutes", 0))
-                seconds = int(function_call.get("seconds", 0))
-                timer_id = function_call.get("timer_id", "default")
-                result = SystemController.set_timer(minutes, seconds, timer_id)
-                return result
-            
-            elif func_name == "get_timer_status":
-                timer_id = function_call.get("timer_id", "default")
-                result = SystemController.get_timer_status(timer_id)
-                return result
-            
-            elif func_name == "cancel_timer":
-                timer_id = function_call.get("timer_id", "default")
-                result = SystemController.cancel_timer(timer_id)
-                return result
-            
-            elif func_name == "open_application":
-                app_name = function_call.get("app_name", "")
-                result = SystemController.open_application(app_name)
-                return {
-                    "status": "success" if result else "failed",
-                    "message": f"Application '{app_name}' opened" if result else f"Could not open '{app_name}'",
-                    "function": func_name
-                }
-            
-            elif func_name == "toggle_bluetooth":
-                action = function_call.get("action", "toggle").lower()
-                enable = action == "on" if action != "toggle" else None
-                result = SystemController.toggle_bluetooth(enable)
-                return {
-                    "status": "success" if result else "failed",
-                    "message": f"Bluetooth turned {action}" if result else "Could not toggle Bluetooth",
-                    "function": func_name
-                }
-            
-            elif func_name == "toggle_wifi":
-                action = function_call.get("action", "toggle").lower()
-                enable = action == "on" if action != "toggle" else None
-                result = SystemController.toggle_wifi(enable)
-                return {
-                    "status": "success" if result else "failed",
-                    "message": f"Wi-Fi turned {action}" if result else "Could not toggle Wi-Fi",
-                    "function": func_name
-                }
-            
-            elif func_name == "change_background":
-                # Check if it's a file path or color name
-                background_input = function_call.get("color", function_call.get("image_path", "blue"))
-                
-                # Try to use it as file path first (if it looks like a path)
-                if "\\" in background_input or "/" in background_input or background_input.endswith((".png", ".jpg", ".jpeg", ".bmp")):
-                    result = SystemController.change_background(image_path=background_input)
-                else:
-                    # It's a color name
-                    hex_color = SystemController.convert_color_name_to_hex(background_input)
-                    result = SystemController.change_background(color=hex_color)
-                
-                return {
-                    "status": "success" if result else "failed",
-                    "message": f"Background changed to {background_input}" if result else "Could not change background",
-                    "function": func_name
-                }
-            
-            elif func_name == "set_brightness":
-                level = function_call.get("level", 50)
-                result = SystemController.set_brightness(int(level))
-                return {
-                    "status": "success" if result else "failed",
-                    "message": f"Brightness set to {level}%" if result else "Could not set brightness",
-                    "function": func_name
-                }
-            
-            elif func_name == "set_volume":
-                level = function_call.get("level")
-                level_text = function_call.get("level_text")
-                result = SystemController.set_volume(level=level, level_text=level_text)
-                return {
-                    "status": result.get("status", "failed"),
-                    "message": result.get("message", "Could not set volume"),
-                    "volume": result.get("volume"),
-                    "function": func_name
-                }
-            
-            elif func_name == "control_volume":
-                action = function_call.get("action", "mute").lower()
-                level = function_call.get("level")
-                result = SystemController.control_volume(action, level=level)
-                return {
-                    "status": result.get("status", "failed") if isinstance(result, dict) else ("success" if result else "failed"),
-                    "message": result.get("message", "Could not control volume") if isinstance(result, dict) else ("Volume controlled" if result else "Could not control volume"),
-                    "function": func_name
-                }
-            
-            elif func_name == "lock_screen":
-                result = SystemController.lock_screen()
-                return {
-                    "status": "success" if result else "failed",
-                    "message": "Screen locked" if result else "Could not lock screen",
-                    "function": func_name
-                }
-            
-            elif func_name == "sleep_system":
-                result = SystemController.sleep_system()
-                return {
-                    "status": "success" if result else "failed",
-                    "message": "System going to sleep" if result else "Could not put system to sleep",
-                    "function": func_name
-                }
-            
-            elif func_name == "shutdown_system":
-                result = SystemController.shutdown_system()
-                return {
-                    "status": "success" if result else "failed",
-                    "message": "System shutting down" if result else "Could not shutdown system",
-                    "function": func_name
-                }
-            
-            elif func_name == "restart_system":
-                result = SystemController.restart_system()
-                return {
-                    "status": "success" if result else "failed",
-                    "message": "System restarting" if result else "Could not restart system",
-                    "function": func_name
-                }
-            
-            elif func_name == "toggle_airplane_mode":
-                action = function_call.get("action", "toggle").lower()
-                enable = action == "on" if action != "toggle" else None
-                result = SystemController.toggle_airplane_mode(enable)
-                return {
-                    "status": "success" if result else "failed",
-                    "message": f"Airplane mode turned {action}" if result else "Could not toggle airplane mode",
-                    "function": func_name
-                }
-            
-            elif func_name == "open_system_settings":
-                setting_type = function_call.get("setting_type", "")
-                result = SystemController.open_system_settings(setting_type)
-                return {
-                    "status": "success" if result else "failed",
-                    "message": f"Opened {setting_type} settings" if result else f"Could not open {setting_type}",
-                    "function": func_name
-                }
-            
-            elif func_name == "get_system_info":
-                info = SystemController.get_system_info()
-                return {
-                    "status": "success",
-                    "data": info,
-                    "function": func_name
-                }
-            
-            else:
+            handler = FunctionExecutor._HANDLERS.get(func_name)
+            if handler is None:
                 return {
                     "status": "error",
                     "message": f"Unknown function: {func_name}",
                     "function": func_name
                 }
-        
+
+            return handler(params)
+
         except Exception as e:
             error_msg = str(e)
             logger.error(f"Error executing {func_name}: {error_msg}")
@@ -309,9 +470,39 @@ class FunctionExecutor:
                 "function": func_name,
                 "error": error_msg
             }
+
+    @staticmethod
+    def execute_function(function_call: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a function call and return result"""
+        return FunctionExecutor.execute_call(
+            function_call.get("function", ""), function_call)
     
     # ============ NEW PHASE 1 METHODS ============
-    
+
+    # Lazy class-level singletons - StateManager opens SQLite in __init__,
+    # so constructing one per call is pure waste
+    _state_manager: Optional[StateManager] = None
+    _tool_caller: Optional[ToolCaller] = None
+    _singleton_lock = threading.Lock()
+
+    @classmethod
+    def _get_state_manager(cls) -> StateManager:
+        """Get the shared StateManager instance"""
+        if cls._state_manager is None:
+            with cls._singleton_lock:
+                if cls._state_manager is None:
+                    cls._state_manager = StateManager()
+        return cls._state_manager
+
+    @classmethod
+    def _get_tool_caller(cls) -> ToolCaller:
+        """Get the shared ToolCaller instance"""
+        if cls._tool_caller is None:
+            with cls._singleton_lock:
+                if cls._tool_caller is None:
+                    cls._tool_caller = ToolCaller(FunctionExecutor)
+        return cls._tool_caller
+
     @staticmethod
     def execute_with_tool_caller(
         function_call: Dict[str, Any],
@@ -320,7 +511,7 @@ class FunctionExecutor:
         """Execute function using ToolCaller with retry logic"""
         
         if tool_caller is None:
-            tool_caller = ToolCaller(FunctionExecutor)
+            tool_caller = FunctionExecutor._get_tool_caller()
         
         func_name = function_call.get("function", "")
         params = function_call.get("params", {})
@@ -343,47 +534,65 @@ class FunctionExecutor:
     def batch_execute(
         function_calls: list,
         use_retry: bool = True,
-        use_state_manager: bool = True
+        use_state_manager: bool = True,
+        parallel: bool = True
     ) -> list:
-        """Execute multiple function calls"""
-        
-        results = []
-        state_manager = StateManager() if use_state_manager else None
-        tool_caller = ToolCaller(FunctionExecutor) if use_retry else None
-        
+        """Execute multiple function calls
+
+        With parallel=True, independent calls run concurrently in a
+        thread pool - the tools are I/O- or subprocess-bound, so this
+        gives near-linear speedup for multi-tool batches. Pass
+        parallel=False when callers need strict in-order execution.
+        """
+
+        state_manager = FunctionExecutor._get_state_manager() if use_state_manager else None
+        tool_caller = FunctionExecutor._get_tool_caller() if use_retry else None
+        state_lock = threading.Lock()
+        pending = []
+
         logger.info(f"Batch executing {len(function_calls)} function calls")
-        
-        for call in function_calls:
+
+        def worker(call):
             if use_retry:
                 result = FunctionExecutor.execute_with_tool_caller(call, tool_caller)
             else:
                 result = FunctionExecutor.execute_function(call)
-            
-            # Store in state manager
+
+            # Buffer for one bulk insert after the batch - a commit per
+            # call would dominate the batch runtime
             if state_manager:
-                state_manager.add_tool_call(
-                    function_name=call.get("function"),
-                    params=call.get("params"),
-                    status=result.get("status"),
-                    result=result,
-                    execution_time_ms=result.get("execution_time_ms", 0)
-                )
-            
-            results.append(result)
-        
+                with state_lock:
+                    pending.append({
+                        "function_name": call.get("function"),
+                        "params": call.get("params"),
+                        "status": result.get("status"),
+                        "result": result,
+                        "execution_time_ms": result.get("execution_time_ms", 0)
+                    })
+
+            return result
+
+        if parallel and len(function_calls) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(function_calls))) as executor:
+                results = list(executor.map(worker, function_calls))
+        else:
+            results = [worker(call) for call in function_calls]
+
+        if state_manager:
+            state_manager.add_tool_calls_bulk(pending)
+
         logger.info(f"Batch execution completed: {len(results)} results")
         return results
     
     @staticmethod
     def get_execution_statistics() -> Dict[str, Any]:
         """Get execution statistics from state manager"""
-        state_manager = StateManager()
-        return state_manager.get_tool_statistics()
+        return FunctionExecutor._get_state_manager().get_tool_statistics()
     
     @staticmethod
     def get_function_history(limit: int = 50) -> list:
         """Get function execution history"""
-        state_manager = StateManager()
+        state_manager = FunctionExecutor._get_state_manager()
         try:
             return state_manager.get_tool_calls(limit=limit)
         except Exception as e:
@@ -392,3 +601,28 @@ class FunctionExecutor:
                 "message": str(e),
                 "function": "get_function_history"
             }
+
+
+# Params dicts are constant too - serialize each one exactly once
+for _v in FunctionExecutor.AVAILABLE_FUNCTIONS.values():
+    _v["_params_json"] = json.dumps(_v["params"])
+del _v
+
+
+def _build_function_definitions() -> str:
+    """Build the function definitions string for Ollama prompts"""
+    definitions = "Available Functions:\n"
+    definitions += "================\n\n"
+
+    for func_name, func_info in FunctionExecutor.AVAILABLE_FUNCTIONS.items():
+        definitions += f"Function: {func_name}\n"
+        definitions += f"Description: {func_info['description']}\n"
+        definitions += f"Parameters: {func_info['_params_json']}\n"
+        definitions += f"Example: {func_info['example']}\n\n"
+
+    return definitions
+
+
+# AVAILABLE_FUNCTIONS is a class constant, so the definitions string is
+# invariant - build it once at import time instead of on every prompt
+_FUNCTION_DEFS_CACHE = _build_function_definitions()
@@ -3,25 +3,54 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QLineEdit, QPushButton, QTextEdit, QLabel,
                              QComboBox, QSlider, QSpinBox)
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QFont, QIcon
+from PyQt6.QtGui import QFont, QIcon, QTextCursor
 from ollama_agent import OllamaAgent
 from system_controller import SystemController
 from function_executor import FunctionExecutor
 import json
+import queue
+
+# System-info section layout - immutable, shared across all renders
+_SECTIONS = (
+    ("Operating System", ("System", "OS_Name", "OS_Version", "Release", "System_Type")),
+    ("Processor & GPU", ("Processor_Count", "Processor", "GPU")),
+    ("Memory", ("Total_RAM", "Available_RAM")),
+    ("Storage", ("Total_Disk", "Used_Disk", "Free_Disk")),
+    ("Other", ("Hostname", "Boot_Time", "Python_Version")),
+)
 
 class OllamaWorker(QThread):
-    """Worker thread for Ollama requests"""
+    """Persistent worker thread for Ollama requests
+
+    One long-lived thread pulls user inputs from a queue instead of
+    spawning (and leaking) a fresh QThread per message.
+    """
     response_signal = pyqtSignal(str)
-    
-    def __init__(self, agent, user_input):
+
+    def __init__(self, agent):
         super().__init__()
         self.agent = agent
-        self.user_input = user_input
-    
+        self.queue = queue.Queue()
+
+    def submit(self, user_input):
+        """Queue a user input for processing"""
+        self.queue.put(user_input)
+
+    def stop(self):
+        """Signal the worker loop to exit"""
+        self.queue.put(None)
+
     def run(self):
+        while True:
+            user_input = self.queue.get()
+            if user_input is None:
+                break
+            self._process(user_input)
+
+    def _process(self, user_input):
         try:
             # Use Ollama's function executor to understand and execute the command
-            result = self.agent.execute_function(self.user_input)
+            result = self.agent.execute_function(user_input)
             
             # Check if this is a scheduled command
             if result.get("scheduled"):
@@ -62,12 +91,12 @@ class OllamaWorker(QThread):
             
             elif result.get("status") == "error":
                 # Error occurred - try fallback to chat
-                response = self.agent.chat(self.user_input)
+                response = self.agent.chat(user_input)
                 self.response_signal.emit(response)
-            
+
             else:
                 # Fallback to general chat
-                response = self.agent.chat(self.user_input)
+                response = self.agent.chat(user_input)
                 self.response_signal.emit(response)
             
         except Exception as e:
@@ -75,28 +104,19 @@ class OllamaWorker(QThread):
     
     def _format_system_info(self, info: dict) -> str:
         """Format system information for display"""
-        output = ""
-        
-        # Organize information by category
-        sections = {
-            "Operating System": ["System", "OS_Name", "OS_Version", "Release", "System_Type"],
-            "Processor & GPU": ["Processor_Count", "Processor", "GPU"],
-            "Memory": ["Total_RAM", "Available_RAM"],
-            "Storage": ["Total_Disk", "Used_Disk", "Free_Disk"],
-            "Other": ["Hostname", "Boot_Time", "Python_Version"]
-        }
-        
-        for section, keys in sections.items():
-            section_data = {k: info.get(k) for k in keys if k in info and info.get(k)}
-            if section_data:
-                output += f"\n{section}:\n"
-                output += "-" * 50 + "\n"
-                for key, value in section_data.items():
-                    # Format key name
-                    display_key = key.replace("_", " ")
-                    output += f"  {display_key}: {value}\n"
-        
-        return output
+        parts = []
+
+        for section, keys in _SECTIONS:
+            rows = [
+                f"  {key.replace('_', ' ')}: {info[key]}\n"
+                for key in keys if info.get(key)
+            ]
+            if rows:
+                parts.append(f"\n{section}:\n")
+                parts.append("-" * 50 + "\n")
+                parts.extend(rows)
+
+        return "".join(parts)
 
 class OllamaAssistantGUI(QMainWindow):
     """GUI for Ollama OS Assistant"""
@@ -105,6 +125,12 @@ class OllamaAssistantGUI(QMainWindow):
         super().__init__()
         self.agent = OllamaAgent()
         self.system = SystemController()
+
+        # Single persistent worker thread for all Ollama requests
+        self.worker = OllamaWorker(self.agent)
+        self.worker.response_signal.connect(self.on_response)
+        self.worker.start()
+
         self.init_ui()
         self.setWindowTitle("Ollama OS Assistant - Intelligent System Control")
         self.setGeometry(100, 100, 900, 700)
@@ -175,6 +201,7 @@ class OllamaAssistantGUI(QMainWindow):
         chat_label = QLabel("Messages:")
         self.chat_display = QTextEdit()
         self.chat_display.setReadOnly(True)
+        self.chat_display.setAcceptRichText(False)
         self.chat_display.setMinimumHeight(300)
         chat_layout.addWidget(chat_label)
         chat_layout.addWidget(self.chat_display)
@@ -265,10 +292,8 @@ class OllamaAssistantGUI(QMainWindow):
         self.append_message("You", user_input)
         self.input_field.clear()
         
-        # Send to worker thread
-        self.worker = OllamaWorker(self.agent, user_input)
-        self.worker.response_signal.connect(self.on_response)
-        self.worker.start()
+        # Hand off to the persistent worker thread
+        self.worker.submit(user_input)
     
     def on_response(self, response):
         """Handle response from agent"""
@@ -276,7 +301,11 @@ class OllamaAssistantGUI(QMainWindow):
     
     def append_message(self, sender, message):
         """Append message to chat display"""
-        self.chat_display.append(f"<b>{sender}:</b> {message}\n")
+        # Plain-text insert in one call - skips the HTML parser and avoids
+        # a full document reflow per message
+        cursor = self.chat_display.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(f"{sender}: {message}\n\n")
     
     def quick_background(self):
         """Quick background color selector"""
@@ -295,14 +324,20 @@ class OllamaAssistantGUI(QMainWindow):
     
     def show_system_info(self):
         """Show system information"""
-        info = SystemController.get_system_info()
+        info = SystemController.get_system_info_cached()
         info_text = "\n".join([f"{k}: {v}" for k, v in info.items()])
         self.append_message("System", f"System Information:\n{info_text}")
     
     def clear_chat(self):
         """Clear chat display"""
         self.chat_display.clear()
-        self.agent.conversation_history = []
+        self.agent.conversation_history.clear()
+
+    def closeEvent(self, event):
+        """Shut down the worker thread on window close"""
+        self.worker.stop()
+        self.worker.wait()
+        event.accept()
 
 def main():
     app = QApplication(sys.argv)
@@ -5,11 +5,24 @@ Intelligent System Control via Natural Language
 
 import sys
 import os
-from ollama_agent import OllamaAgent
-from system_controller import SystemController
+
+def launch_gui():
+    """Launch the graphical interface"""
+    # GUI-only imports stay out of module scope so the CLI path never
+    # pays for PyQt6 (and vice versa)
+    from gui import OllamaAssistantGUI
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+    window = OllamaAssistantGUI()
+    window.show()
+    sys.exit(app.exec())
 
 def cli_mode():
     """Command line interface mode"""
+    from ollama_agent import OllamaAgent
+    from system_controller import SystemController
+
     print("=" * 60)
     print("🤖 Ollama OS Assistant - Intelligent System Control")
     print("=" * 60)
@@ -24,31 +37,36 @@ def cli_mode():
     print("=" * 60)
     
     agent = OllamaAgent()
-    
+
+    def open_gui():
+        print("Opening graphical interface...")
+        launch_gui()
+
+    def show_info():
+        info = SystemController.get_system_info()
+        print("\nSystem Information:")
+        for key, value in info.items():
+            print(f"  {key}: {value}")
+
+    # Built-in commands dispatch through a dict; anything else goes to the agent
+    commands = {
+        'gui': open_gui,
+        'info': show_info,
+    }
+
     while True:
         try:
             user_input = input("\nYou: ").strip()
-            
-            if user_input.lower() == 'exit':
+            cmd = user_input.lower()
+
+            if cmd == 'exit':
                 print("Goodbye!")
                 break
-            
-            elif user_input.lower() == 'gui':
-                print("Opening graphical interface...")
-                from gui import OllamaAssistantGUI
-                from PyQt6.QtWidgets import QApplication
-                
-                app = QApplication(sys.argv)
-                window = OllamaAssistantGUI()
-                window.show()
-                sys.exit(app.exec())
-            
-            elif user_input.lower() == 'info':
-                info = SystemController.get_system_info()
-                print("\nSystem Information:")
-                for key, value in info.items():
-                    print(f"  {key}: {value}")
-            
+
+            handler = commands.get(cmd)
+            if handler:
+                handler()
+
             else:
                 # Parse and execute command
                 command = agent.parse_command(user_input)
@@ -71,12 +89,6 @@ def cli_mode():
 if __name__ == '__main__':
     # Check if GUI requested
     if len(sys.argv) > 1 and sys.argv[1] == 'gui':
-        from gui import OllamaAssistantGUI
-        from PyQt6.QtWidgets import QApplication
-        
-        app = QApplication(sys.argv)
-        window = OllamaAssistantGUI()
-        window.show()
-        sys.exit(app.exec())
-else:
-    cli_mode()
+        launch_gui()
+    else:
+        cli_mode()
@@ -1,17 +1,120 @@
+import asyncio
+import collections
+import itertools
+import threading
 import requests
 import json
 import re
 import os
 import logging
-from typing import Dict, Any, List, Optional, Generator
+from typing import Dict, Any, Callable, List, Optional, Generator
+from dataclasses import dataclass
 from datetime import datetime
-from schema_validator import SchemaValidator
-from tool_caller import ToolCaller
-from streaming_handler import StreamingHandler, StreamClient
-from state_manager import StateManager
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+# Allow quieting the per-request logging in production runs; unknown
+# values fall back to INFO instead of raising at import time
+_log_level = os.environ.get("OLLAMA_AGENT_LOG", "INFO").upper()
+if _log_level not in ("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"):
+    _log_level = "INFO"
+logger.setLevel(_log_level)
+
+# Patterns used on every user turn - compiled once instead of hitting the
+# re module cache on each call
+_DELAY_RE = re.compile(r'\b(after|in)\s+(\d+)\s+(second|minute|hour)s?', re.IGNORECASE)
+_JSON_ARR_RE = re.compile(r'\[.*\]', re.DOTALL)
+
+
+@dataclass(frozen=True)
+class DelayInfo:
+    """Result of scanning a command for an execution delay"""
+    has_delay: bool
+    delay_seconds: int
+    delay_display: str
+    clean_input: str
+
+
+def _first_json_object(text: str) -> Optional[str]:
+    """Return the first balanced JSON object in text, or None
+
+    Forward scan tracking brace depth, string state and escapes - unlike
+    the old regexes it handles nested objects. A candidate '{' that never
+    balances (a stray brace in prose) is skipped and the scan retries
+    from the next brace.
+    """
+    search_from = 0
+    while True:
+        start = text.find('{', search_from)
+        if start == -1:
+            return None
+
+        depth = 0
+        in_string = False
+        escape = False
+
+        for i in range(start, len(text)):
+            ch = text[i]
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = not in_string
+            elif not in_string:
+                if ch == '{':
+                    depth += 1
+                elif ch == '}':
+                    depth -= 1
+                    if depth == 0:
+                        return text[start:i + 1]
+
+        search_from = start + 1
+
+# Deterministic command rules, tried before any model round trip. A match
+# turns a 1-3 s inference into a microsecond dispatch; anything ambiguous
+# falls through to Ollama.
+_LEVEL_ALIASES = {"middle": "mid"}
+_VOLUME_ACTIONS = {"raise": "increase", "lower": "decrease", "up": "increase", "down": "decrease"}
+_FAST_RULES = (
+    (re.compile(r'(mute|unmute)\s+(?:the\s+)?(?:volume|sound)\Z', re.IGNORECASE),
+     lambda m: {"function": "control_volume", "action": m.group(1).lower()}),
+    (re.compile(r'set\s+(?:the\s+)?volume\s+to\s+(\d{1,3})%?\Z', re.IGNORECASE),
+     lambda m: {"function": "set_volume", "level": int(m.group(1))}),
+    (re.compile(r'set\s+(?:the\s+)?volume\s+(?:to\s+)?(low|mid|middle|high)\Z', re.IGNORECASE),
+     lambda m: {"function": "set_volume",
+                "level_text": _LEVEL_ALIASES.get(m.group(1).lower(), m.group(1).lower())}),
+    (re.compile(r'(increase|decrease|raise|lower)\s+(?:the\s+)?(?:volume|sound)\Z', re.IGNORECASE),
+     lambda m: {"function": "control_volume",
+                "action": _VOLUME_ACTIONS.get(m.group(1).lower(), m.group(1).lower())}),
+    (re.compile(r'set\s+(?:the\s+)?brightness\s+to\s+(\d{1,3})%?\Z', re.IGNORECASE),
+     lambda m: {"function": "set_brightness", "level": int(m.group(1))}),
+    # Single-token names only: multi-word tails like "wifi settings" are
+    # ambiguous (settings page vs application) and belong to the model
+    (re.compile(r'(?:open|launch|start)\s+([\w.-]+)\Z', re.IGNORECASE),
+     lambda m: {"function": "open_application", "app_name": m.group(1)}),
+    (re.compile(r'(?:show\s+)?system\s+info(?:rmation)?\Z', re.IGNORECASE),
+     lambda m: {"function": "get_system_info"}),
+    (re.compile(r'lock\s+(?:the\s+)?screen\Z', re.IGNORECASE),
+     lambda m: {"function": "lock_screen"}),
+    (re.compile(r'change\s+(?:the\s+)?background\s+to\s+(\w+)\Z', re.IGNORECASE),
+     lambda m: {"function": "change_background", "color": m.group(1).lower()}),
+)
+
+# Optional async HTTP client - without it, async requests fall back to
+# running the blocking path in worker threads
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Optional C JSON codec for the request hot path
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
 
 
 class OllamaAgent:
@@ -19,12 +122,50 @@ class OllamaAgent:
     
     def __init__(self, model_name: str = None, base_url: str = "http://localhost:11434", use_streaming: bool = False):
         self.base_url = base_url
-        self.conversation_history = []
+        # Bounded history - chat() only prompts with the last few turns,
+        # so old entries just grow memory
+        self.conversation_history = collections.deque(maxlen=64)
         self.available_models = []  # Cache for available models
         self.config_file = "config.json"
         self.use_streaming = use_streaming
-        
-        # Initialize components
+        self._async_client = None  # Batch-scoped httpx.AsyncClient, never cached across loops
+        self._exec_prompt_prefix = None  # Static prompt prefix, built on first use
+        self._schema_prompt_prefixes = {}  # schema_name -> static prompt prefix
+        self._config_cache = None  # Parsed config.json, loaded once
+        # (model, input) -> raw model reply; parses are deterministic
+        # enough to reuse, execution side effects still repeat
+        self._llm_parse_cache = collections.OrderedDict()
+
+        # Pooled keep-alive session - avoids a TCP handshake per request
+        # across the many small /api/generate and /api/tags calls
+        self._http = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=32)
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+        self._http.headers["Connection"] = "keep-alive"
+
+        # Prefer a Unix-domain-socket transport when the local Ollama
+        # exposes one - skips the loopback TCP stack for every call
+        self._uds_client = None
+        if httpx is not None and os.name == "posix":
+            sock_path = os.path.expanduser("~/.ollama/ollama.sock")
+            if os.path.exists(sock_path):
+                try:
+                    self._uds_client = httpx.Client(
+                        transport=httpx.HTTPTransport(uds=sock_path),
+                        timeout=60
+                    )
+                    logger.info("Using Ollama Unix socket at %s", sock_path)
+                except Exception as e:
+                    logger.warning("Could not use Ollama socket: %s", e)
+        
+        # Initialize components - imported here so merely importing this
+        # module stays cheap (the GUI pulls it in at startup)
+        from schema_validator import SchemaValidator
+        from tool_caller import ToolCaller
+        from streaming_handler import StreamingHandler, StreamClient
+        from state_manager import StateManager
+
         self.schema_validator = SchemaValidator()
         self.tool_caller = ToolCaller()
         self.streaming_handler = StreamingHandler(base_url)
@@ -37,13 +178,32 @@ class OllamaAgent:
         else:
             self.model_name = self._load_model_from_config() or "mistral"
         
-        logger.info(f"OllamaAgent initialized with model: {self.model_name}")
+        logger.info("OllamaAgent initialized with model: %s", self.model_name)
+
+        # Load the model into server memory before the first real command
+        threading.Thread(target=self._warmup, daemon=True).start()
+
+    def _warmup(self):
+        """Trigger model load so the first user command pays only inference
+
+        An empty prompt makes Ollama load the model without generating
+        tokens; keep_alive stops it from being unloaded between commands.
+        """
+        try:
+            self._api_post("/api/generate", {
+                "model": self.model_name,
+                "prompt": "",
+                "keep_alive": "30m",
+                "stream": False
+            }, timeout=120)
+            logger.info("Model %s warmed up", self.model_name)
+        except Exception as e:
+            logger.debug("Warm-up skipped: %s", e)
     
-    def _extract_delay(self, user_input: str) -> Dict[str, Any]:
+    def _extract_delay(self, user_input: str) -> DelayInfo:
         """Extract delay information from user input"""
         # Pattern to match: "after X seconds/minutes/hours" or "in X seconds/minutes/hours"
-        pattern = r'\b(after|in)\s+(\d+)\s+(second|minute|hour)s?'
-        match = re.search(pattern, user_input, re.IGNORECASE)
+        match = _DELAY_RE.search(user_input)
         
         if match:
             number = int(match.group(2))
@@ -59,68 +219,77 @@ class OllamaAgent:
             else:
                 delay_seconds = 0
             
-            # Format display string
-            if delay_seconds >= 3600:
-                hours = delay_seconds // 3600
-                delay_display = f"{hours} hour{'s' if hours > 1 else ''}"
-            elif delay_seconds >= 60:
-                minutes = delay_seconds // 60
-                delay_display = f"{minutes} minute{'s' if minutes > 1 else ''}"
-            else:
-                delay_display = f"{delay_seconds} second{'s' if delay_seconds > 1 else ''}"
+            # Format display string - the parsed number and unit are the
+            # display values, no need to re-derive them from the total
+            delay_display = f"{number} {unit}{'s' * (number > 1)}"
             
             # Remove the delay part from input to get the clean command
-            clean_input = re.sub(pattern, '', user_input, flags=re.IGNORECASE).strip()
-            
-            return {
-                "has_delay": True,
-                "delay_seconds": delay_seconds,
-                "delay_display": delay_display,
-                "clean_input": clean_input
-            }
-        
-        return {"has_delay": False, "delay_seconds": 0, "clean_input": user_input, "delay_display": ""}
-    
-    def _load_model_from_config(self) -> str:
-        """Load the last used model from config.json"""
-        try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    return config.get("ollama", {}).get("model", "mistral")
-        except Exception as e:
-            print(f"Error loading model from config: {e}")
-        return "mistral"
+            clean_input = _DELAY_RE.sub('', user_input).strip()
+
+            return DelayInfo(
+                has_delay=True,
+                delay_seconds=delay_seconds,
+                delay_display=delay_display,
+                clean_input=clean_input
+            )
+
+        return DelayInfo(has_delay=False, delay_seconds=0, delay_display="", clean_input=user_input)
     
-    def _save_model_to_config(self, model_name: str) -> bool:
-        """Save the selected model to config.json"""
+    def _read_config(self) -> Dict[str, Any]:
+        """Load config.json once and reuse the parsed dict"""
+        if self._config_cache is None:
+            self._config_cache = {}
+            try:
+                if os.path.exists(self.config_file):
+                    with open(self.config_file, 'r', encoding='utf-8') as f:
+                        self._config_cache = json.load(f)
+            except Exception as e:
+                print(f"Error loading config: {e}")
+        return self._config_cache
+
+    def _write_config(self) -> bool:
+        """Persist the cached config dict atomically"""
         try:
-            config = {}
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-            
-            if "ollama" not in config:
-                config["ollama"] = {}
-            
-            config["ollama"]["model"] = model_name
-            
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
-            
+            tmp_path = self.config_file + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                if orjson is not None:
+                    f.write(orjson.dumps(self._config_cache, option=orjson.OPT_INDENT_2).decode())
+                else:
+                    json.dump(self._config_cache, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.config_file)
             return True
         except Exception as e:
-            print(f"Error saving model to config: {e}")
+            print(f"Error saving config: {e}")
             return False
+
+    def _load_model_from_config(self) -> str:
+        """Load the last used model from config.json"""
+        return self._read_config().get("ollama", {}).get("model", "mistral")
+
+    def _save_model_to_config(self, model_name: str) -> bool:
+        """Save the selected model to config.json"""
+        self._read_config().setdefault("ollama", {})["model"] = model_name
+        return self._write_config()
     
+    def _api_get(self, path: str, timeout: int = 5):
+        """GET an Ollama API path over the socket or pooled session"""
+        if self._uds_client is not None:
+            return self._uds_client.get(f"http://localhost{path}", timeout=timeout)
+        return self._http.get(f"{self.base_url}{path}", timeout=timeout)
+
+    def _api_post(self, path: str, payload: Dict[str, Any], timeout: int = 60):
+        """POST to an Ollama API path over the socket or pooled session"""
+        if self._uds_client is not None:
+            return self._uds_client.post(f"http://localhost{path}", json=payload, timeout=timeout)
+        return self._http.post(f"{self.base_url}{path}", json=payload, timeout=timeout)
+
     def get_available_models(self) -> List[str]:
         """Fetch list of available models from Ollama"""
         try:
-            url = f"{self.base_url}/api/tags"
-            response = requests.get(url, timeout=5)
+            response = self._api_get("/api/tags", timeout=5)
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             models = data.get("models", [])
             
             # Extract model names
@@ -140,7 +309,8 @@ class OllamaAgent:
         
         if model_name in self.available_models or not self.available_models:
             self.model_name = model_name
-            self.conversation_history = []  # Clear history when switching models
+            self.conversation_history.clear()  # Clear history when switching models
+            self._llm_parse_cache.clear()  # Cache keys include the old model
             self._save_model_to_config(model_name)  # Save preference to config
             return True
         return False
@@ -148,20 +318,19 @@ class OllamaAgent:
     def send_request(self, prompt: str) -> str:
         """Send request to Ollama and get response"""
         try:
-            url = f"{self.base_url}/api/generate"
-            
             payload = {
                 "model": self.model_name,
                 "prompt": prompt,
                 "stream": False,
                 "temperature": 0.7,
                 "top_p": 0.9,
+                "keep_alive": "30m",
             }
-            
-            response = requests.post(url, json=payload, timeout=60)
+
+            response = self._api_post("/api/generate", payload, timeout=60)
             response.raise_for_status()
             
-            result = response.json()
+            result = _json_loads(response.content)
             return result.get("response", "").strip()
             
         except requests.exceptions.ConnectionError:
@@ -169,43 +338,161 @@ class OllamaAgent:
         except Exception as e:
             return f"Error: {str(e)}"
     
+    @staticmethod
+    def _wrap_scheduled(delay_info: DelayInfo, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Wrap a successful function-call result for delayed execution"""
+        if delay_info.has_delay and result.get("status") == "success" and "function" in result:
+            return {
+                "status": "success",
+                "message": f"⏱️ Will execute in {delay_info.delay_display}",
+                "scheduled": True,
+                "delay": delay_info.delay_seconds,
+                "original_result": result
+            }
+        return result
+
+    def _with_delay(self, user_input: str, dispatch: Callable[[str], Dict[str, Any]]) -> Dict[str, Any]:
+        """Run the delay scan once and dispatch on the cleaned input
+
+        dispatch receives input with any delay phrase already stripped,
+        so it must not re-scan for delays.
+        """
+        delay_info = self._extract_delay(user_input)
+        return self._wrap_scheduled(delay_info, dispatch(delay_info.clean_input))
+
     def execute_function(self, user_input: str) -> Dict[str, Any]:
         """Use Ollama to understand the user's intent and return a function call"""
+        return self._with_delay(user_input, self._execute_now)
+
+    def _execute_now(self, user_input: str) -> Dict[str, Any]:
+        """Parse and execute a command that carries no delay phrase"""
+        # Deterministic fast path - skip the model for unambiguous commands
+        fast_call = self._match_fast_rule(user_input)
+        if fast_call is not None:
+            from function_executor import FunctionExecutor
+            return FunctionExecutor.execute_function(fast_call)
+
+        if self.use_streaming:
+            response = self._cached_parse_response(
+                "execute", user_input,
+                lambda: self.send_request_early_json(self._build_execute_prompt(user_input))
+            )
+        else:
+            response = self._cached_parse_response(
+                "execute", user_input,
+                lambda: self.send_request(self._build_execute_prompt(user_input))
+            )
+        return self._handle_execute_response(response)
+
+    def _cached_parse_response(self, kind: str, user_input: str,
+                               send: Callable[[], str]) -> str:
+        """Reuse the raw model reply for a repeated (kind, model, input) triple
+
+        kind names the call site ("parse"/"execute") - the two paths send
+        different prompts and expect different reply shapes, so their
+        entries must not be interchangeable. A retyped command skips the
+        whole inference round trip; the resulting function call is still
+        executed each time.
+        """
+        key = (kind, self.model_name, user_input)
+        cached = self._llm_parse_cache.get(key)
+        if cached is not None:
+            self._llm_parse_cache.move_to_end(key)
+            return cached
+
+        response = send()
+
+        # Don't pin transport errors in the cache
+        if not response.startswith("Error"):
+            self._llm_parse_cache[key] = response
+            if len(self._llm_parse_cache) > 512:
+                self._llm_parse_cache.popitem(last=False)
+        return response
+
+    def _match_fast_rule(self, user_input: str) -> Optional[Dict[str, Any]]:
+        """Build a function call for deterministic commands, else None"""
+        stripped = user_input.strip()
+        for pattern, build in _FAST_RULES:
+            match = pattern.match(stripped)
+            if match:
+                return build(match)
+        return None
+
+    def send_request_early_json(
+        self,
+        prompt: str,
+        on_token: Optional[callable] = None
+    ) -> str:
+        """Stream a completion and stop once a balanced JSON object arrives
+
+        Function-call replies are a single JSON object, so cutting the
+        stream at the closing brace skips any trailing prose the model
+        appends and starts execution at first-object time instead of
+        full-completion time.
+        """
+        parts = []
+        depth = 0
+        started = False
+        in_string = False
+        escape = False
+
+        for token in self.streaming_handler.stream_generate(self.model_name, prompt):
+            parts.append(token)
+            if on_token:
+                on_token(token)
+
+            # Same string/escape state machine as _first_json_object -
+            # braces inside JSON string values must not move the depth
+            for ch in token:
+                if not started:
+                    if ch == '{':
+                        started = True
+                        depth = 1
+                    continue
+                if escape:
+                    escape = False
+                elif ch == '\\':
+                    escape = True
+                elif ch == '"':
+                    in_string = not in_string
+                elif not in_string:
+                    if ch == '{':
+                        depth += 1
+                    elif ch == '}':
+                        depth -= 1
+
+            if started and depth <= 0:
+                self.streaming_handler.stop_stream()
+                break
+
+        return "".join(parts).strip()
+
+    def _build_execute_prompt(self, user_input: str) -> str:
+        """Build the intent-parsing prompt for a single command
+
+        The static prefix is built once; keeping it byte-identical
+        across calls also lets the Ollama server reuse its prompt-prefix
+        KV cache instead of re-prefilling those tokens.
+        """
+        return (
+            self._get_exec_prompt_prefix()
+            + f'\nUser Command: "{user_input}"\n\nRespond only with JSON, no other text.'
+        )
+
+    def _get_exec_prompt_prefix(self) -> str:
+        """Get the static part of the intent-parsing prompt (cached)"""
+        if self._exec_prompt_prefix is not None:
+            return self._exec_prompt_prefix
+
         from function_executor import FunctionExecutor
-        from system_controller import SystemController
-        
-        # First, check if this is a delayed/scheduled command
-        delay_info = self._extract_delay(user_input)
-        if delay_info["has_delay"]:
-            # Remove the delay part from the command
-            clean_input = delay_info["clean_input"]
-            delay_seconds = delay_info["delay_seconds"]
-            
-            # Recursively process the cleaned command without delay
-            result = self.execute_function(clean_input)
-            
-            # If it's a function call, schedule it instead of executing immediately
-            if result.get("status") == "success" and "function" in result:
-                # Schedule the function to run after delay
-                return {
-                    "status": "success",
-                    "message": f"⏱️ Will execute in {delay_info['delay_display']}",
-                    "scheduled": True,
-                    "delay": delay_seconds,
-                    "original_result": result
-                }
-            return result
-        
-        # Get available functions
+
         function_defs = FunctionExecutor.get_function_definitions()
-        
-        system_prompt = f"""You are an intelligent OS assistant with access to system functions.
+
+        self._exec_prompt_prefix = f"""You are an intelligent OS assistant with access to system functions.
 You understand English commands.
 
 {function_defs}
 
-User Command: "{user_input}"
-
 IMPORTANT INSTRUCTIONS:
 
 1. For "set_volume" or "control_volume" functions:
@@ -239,16 +526,18 @@ Examples:
 - "open notepad" → {{"function": "open_application", "app_name": "notepad"}}
 - "set timer for 10 minutes" → {{"function": "set_timer", "minutes": 10}}
 - "change background to blue" → {{"function": "change_background", "color": "blue"}}
+"""
+        return self._exec_prompt_prefix
+
+    def _handle_execute_response(self, response: str) -> Dict[str, Any]:
+        """Parse a model response and execute any function call in it"""
+        from function_executor import FunctionExecutor
 
-Respond only with JSON, no other text."""
-        
-        response = self.send_request(system_prompt)
-        
         # Try to parse JSON response
         try:
-            json_match = re.search(r'\{[^{}]*\}', response, re.DOTALL)
-            if json_match:
-                parsed = json.loads(json_match.group())
+            json_str = _first_json_object(response)
+            if json_str:
+                parsed = _json_loads(json_str)
                 
                 # Check if this is a chat response
                 if parsed.get("type") == "chat":
@@ -272,7 +561,88 @@ Respond only with JSON, no other text."""
             "message": "Could not understand the command.",
             "raw_response": response
         }
-    
+
+    async def asend_request(self, prompt: str) -> str:
+        """Async variant of send_request
+
+        Uses the batch-scoped httpx.AsyncClient when one is active (see
+        aexecute_functions_parallel); otherwise a client just for this
+        call, or a worker thread if httpx is missing. An AsyncClient is
+        bound to the event loop it was created in, so it must never
+        outlive the loop by being cached on the instance. Ollama only
+        executes concurrent inferences when OLLAMA_NUM_PARALLEL > 1 on
+        the server.
+        """
+        if httpx is None:
+            # run_in_executor rather than asyncio.to_thread, which is
+            # Python 3.9+ while the project supports 3.8
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(None, self.send_request, prompt)
+
+        client = self._async_client
+        if client is not None:
+            return await self._apost(client, prompt)
+        async with httpx.AsyncClient(timeout=60) as client:
+            return await self._apost(client, prompt)
+
+    async def _apost(self, client, prompt: str) -> str:
+        """Issue one generate request on the given AsyncClient"""
+        try:
+            payload = {
+                "model": self.model_name,
+                "prompt": prompt,
+                "stream": False,
+                "temperature": 0.7,
+                "top_p": 0.9,
+                "keep_alive": "30m",
+            }
+
+            response = await client.post(f"{self.base_url}/api/generate", json=payload)
+            response.raise_for_status()
+
+            return _json_loads(response.content).get("response", "").strip()
+
+        except httpx.ConnectError:
+            return "Error: Cannot connect to Ollama. Make sure Ollama is running (ollama serve)"
+        except Exception as e:
+            return f"Error: {str(e)}"
+
+    async def aexecute_function(self, user_input: str) -> Dict[str, Any]:
+        """Async twin of execute_function"""
+        delay_info = self._extract_delay(user_input)
+        result = await self._aexecute_now(delay_info.clean_input)
+        return self._wrap_scheduled(delay_info, result)
+
+    async def _aexecute_now(self, user_input: str) -> Dict[str, Any]:
+        """Async twin of _execute_now"""
+        fast_call = self._match_fast_rule(user_input)
+        if fast_call is not None:
+            from function_executor import FunctionExecutor
+            return FunctionExecutor.execute_function(fast_call)
+
+        response = await self.asend_request(self._build_execute_prompt(user_input))
+        return self._handle_execute_response(response)
+
+    async def aexecute_functions_parallel(self, inputs: List[str]) -> List[Dict[str, Any]]:
+        """Run independent commands as concurrent Ollama inferences
+
+        Opens one pooled AsyncClient for the whole batch and closes it
+        before the loop ends, so connections are shared across the batch
+        without a stale client surviving into the next asyncio.run.
+        """
+        if httpx is None:
+            return list(await asyncio.gather(*(self.aexecute_function(x) for x in inputs)))
+        async with httpx.AsyncClient(timeout=60) as client:
+            self._async_client = client
+            try:
+                return list(await asyncio.gather(*(self.aexecute_function(x) for x in inputs)))
+            finally:
+                self._async_client = None
+
+    def execute_functions_parallel(self, inputs: List[str]) -> List[Dict[str, Any]]:
+        """Sync wrapper around aexecute_functions_parallel for CLI callers"""
+        return asyncio.run(self.aexecute_functions_parallel(inputs))
+
     def parse_command(self, user_input: str) -> Dict[str, Any]:
         """Parse user input to understand the intent and extract parameters"""
         
@@ -295,14 +665,15 @@ For command "{user_input}", respond with JSON:
     "confidence": 0-100,
     "explanation": "Brief explanation"
 }}"""
-        
-        response = self.send_request(system_prompt)
+
+        response = self._cached_parse_response(
+            "parse", user_input, lambda: self.send_request(system_prompt))
         
         try:
             # Extract JSON from response
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
+            json_str = _first_json_object(response)
+            if json_str:
+                return _json_loads(json_str)
         except (json.JSONDecodeError, AttributeError):
             pass
         
@@ -312,13 +683,87 @@ For command "{user_input}", respond with JSON:
             "explanation": response
         }
     
+    def parse_commands_batch(self, inputs: List[str]) -> List[Dict[str, Any]]:
+        """Parse several user commands with a single Ollama round trip
+
+        The prompt prefix (function definitions + instructions) is shared
+        across all commands, so one request amortizes it over N inputs
+        instead of paying a model round trip each.
+        """
+        from function_executor import FunctionExecutor
+
+        if not inputs:
+            return []
+
+        function_defs = FunctionExecutor.get_function_definitions()
+        numbered = "\n".join(f'{i}. "{cmd}"' for i, cmd in enumerate(inputs, 1))
+
+        system_prompt = f"""You are an intelligent OS assistant with access to system functions.
+You understand English commands.
+
+{function_defs}
+
+User Commands:
+{numbered}
+
+For each numbered command, decide if it is a system function call or conversation:
+1. System command: {{"function": "function_name", "param1": "value1"}}
+2. Question or conversation: {{"type": "chat", "response": "Your conversational response here"}}
+
+Return a JSON array where element j is the parsed result for command j.
+The array must have exactly {len(inputs)} elements.
+Respond only with the JSON array, no other text."""
+
+        response = self.send_request(system_prompt)
+
+        try:
+            json_match = _JSON_ARR_RE.search(response)
+            if json_match:
+                parsed = _json_loads(json_match.group())
+                if isinstance(parsed, list) and len(parsed) == len(inputs):
+                    return parsed
+        except (json.JSONDecodeError, AttributeError):
+            pass
+
+        logger.warning("Batch parse failed, falling back to per-command requests")
+        return [
+            {
+                "status": "error",
+                "message": "Could not parse batch response.",
+                "raw_response": response
+            }
+            for _ in inputs
+        ]
+
+    def execute_functions_batch(self, inputs: List[str]) -> List[Dict[str, Any]]:
+        """Parse a batch of commands in one model call and execute them"""
+        from function_executor import FunctionExecutor
+
+        parsed = self.parse_commands_batch(inputs)
+
+        results = []
+        for user_input, call in zip(inputs, parsed):
+            if call.get("type") == "chat":
+                results.append({
+                    "status": "success",
+                    "message": call.get("response", "I'm here to help!"),
+                    "is_chat": True
+                })
+            elif call.get("function"):
+                results.append(FunctionExecutor.execute_function(call))
+            else:
+                # Batch parse failed for this entry - one retry on its own
+                results.append(self.execute_function(user_input))
+        return results
+
     def chat(self, user_message: str) -> str:
         """Chat with the agent"""
         self.conversation_history.append({"role": "user", "content": user_message})
         
         # Create context from history
         context = "Conversation history:\n"
-        for msg in self.conversation_history[-5:]:  # Last 5 messages
+        start = max(0, len(self.conversation_history) - 5)
+        for msg in itertools.islice(self.conversation_history, start, None):  # Last 5 messages
             role = "User" if msg["role"] == "user" else "Assistant"
             context += f"{role}: {msg['content']}\n"
         
@@ -340,7 +785,7 @@ Assistant (provide a short and helpful response):"""
         on_complete: Optional[callable] = None
     ) -> str:
         """Send request with streaming support"""
-        logger.info(f"Streaming request with model: {self.model_name}")
+        logger.info("Streaming request with model: %s", self.model_name)
         
         full_response = []
         
@@ -366,37 +811,30 @@ Assistant (provide a short and helpful response):"""
     
     def execute_function_with_schema(self, user_input: str, schema_name: str = "tool_call") -> Dict[str, Any]:
         """Execute function with JSON schema validation"""
+        return self._with_delay(
+            user_input,
+            lambda clean_input: self._execute_with_schema_now(clean_input, schema_name)
+        )
+
+    def _execute_with_schema_now(self, user_input: str, schema_name: str) -> Dict[str, Any]:
+        """Schema-validated execution for a command with no delay phrase"""
         from function_executor import FunctionExecutor
-        
-        # Check for delays first
-        delay_info = self._extract_delay(user_input)
-        if delay_info["has_delay"]:
-            clean_input = delay_info["clean_input"]
-            delay_seconds = delay_info["delay_seconds"]
-            
-            # Recursively process cleaned command
-            result = self.execute_function_with_schema(clean_input, schema_name)
-            
-            if result.get("status") == "success":
-                return {
-                    "status": "success",
-                    "message": f"⏱️ Will execute in {delay_info['delay_display']}",
-                    "scheduled": True,
-                    "delay": delay_seconds,
-                    "original_result": result
-                }
-            return result
-        
-        # Get function definitions and build prompt with schema
-        function_defs = FunctionExecutor.get_function_definitions()
-        schema_prompt = self.schema_validator.create_schema_prompt([schema_name, "response"])
-        
-        system_prompt = f"""You are an intelligent OS assistant with access to system functions.
+
+        # Static per-schema prefix is cached; only the command line varies
+        prefix = self._schema_prompt_prefixes.get(schema_name)
+        if prefix is None:
+            function_defs = FunctionExecutor.get_function_definitions()
+            schema_prompt = self.schema_validator.create_schema_prompt([schema_name, "response"])
+
+            prefix = f"""You are an intelligent OS assistant with access to system functions.
 
 {function_defs}
 
 {schema_prompt}
+"""
+            self._schema_prompt_prefixes[schema_name] = prefix
 
+        system_prompt = prefix + f"""
 User Command: "{user_input}"
 
 IMPORTANT: Always respond with valid JSON matching the tool_call schema.
@@ -416,17 +854,21 @@ Only respond with JSON, no markdown or other text."""
         )
         
         if not is_valid:
-            logger.warning(f"Schema validation failed: {error}")
-            # Try to suggest fix
-            try:
-                data = json.loads(response)
-                fixed_data = self.schema_validator.suggest_fix(data, schema_name)
-                is_valid, error, cleaned_data = self.schema_validator.validate(fixed_data, schema_name)
-            except:
-                pass
+            logger.warning("Schema validation failed: %s", error)
+            # Only attempt a fix when the reply actually contained a
+            # decodable JSON object - no point re-running the pipeline
+            # on prose
+            json_str = _first_json_object(response)
+            if json_str:
+                try:
+                    data = _json_loads(json_str)
+                    fixed_data = self.schema_validator.suggest_fix(data, schema_name)
+                    is_valid, error, cleaned_data = self.schema_validator.validate(fixed_data, schema_name)
+                except Exception:
+                    pass
         
         if not is_valid:
-            logger.error(f"Could not validate response: {error}")
+            logger.error("Could not validate response: %s", error)
             return {
                 "status": "error",
                 "message": "Could not understand the command",
@@ -6,37 +6,221 @@ Handles conversation history, user metrics, and system state persistence
 import sqlite3
 import json
 import logging
+import queue
+import threading
 from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from contextlib import contextmanager
 import os
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Optional C JSON codec for the serialization on every write/read path;
+# both codecs raise ValueError subclasses on bad input
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _dumps = json.dumps
+    _loads = json.loads
+
+
+def _utcnow() -> str:
+    """Current UTC time in SQLite's CURRENT_TIMESTAMP format
+
+    Binding the timestamp from Python spares SQLite a strftime call and
+    a TEXT allocation per inserted row.
+    """
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
 
 class StateManager:
     """Manages conversation state, history, and metrics using SQLite"""
     
     def __init__(self, db_path: str = "state.db"):
         self.db_path = db_path
+        # One long-lived handle shared by every method; opening per call
+        # re-parses the schema and rebuilds the page cache each time.
+        # The RLock serializes access across threads.
+        self._lock = threading.RLock()
+        # cached_statements keeps every hot INSERT/SELECT compiled; the
+        # SQL literals below are identical between calls so lookups hit
+        self._conn = sqlite3.connect(
+            db_path, check_same_thread=False, cached_statements=256
+        )
+        self._conn.row_factory = sqlite3.Row  # Access columns by name
+        for pragma in self._CONNECTION_PRAGMAS:
+            self._conn.execute(pragma)
+        # Write-through preference cache; preferences are read often and
+        # change rarely, so hits skip the SQLite round-trip entirely
+        self._pref_cache: Dict[str, Any] = {}
+        self._pref_cache_complete = False
         self.init_database()
-    
+        # Background writer: SQLite is single-writer anyway, so the
+        # *_async methods just enqueue and return while one daemon
+        # thread drains the queue in fused transactions
+        self._wq: "queue.Queue" = queue.Queue(maxsize=10000)
+        self._writer = threading.Thread(target=self._drain_writes, daemon=True)
+        self._writer.start()
+
+    # Applied once to the persistent connection (these PRAGMAs are
+    # per-connection attributes)
+    _CONNECTION_PRAGMAS = (
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-64000",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA busy_timeout=5000",
+    )
+
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Access columns by name
+        """Context manager yielding the shared connection under the lock"""
+        with self._lock:
+            yield self._conn
+
+    # INSERT statements the writer thread knows how to batch, by kind
+    _WRITE_SQL = {
+        "conversation": """
+            INSERT INTO conversation (
+                timestamp, user_input, model_response, model_used,
+                function_called, function_params,
+                execution_status, execution_time_ms, error_message
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        "metric": """
+            INSERT INTO metrics (timestamp, metric_name, metric_value, tags)
+            VALUES (?, ?, ?, ?)
+        """,
+    }
+
+    def _drain_writes(self):
+        """Writer-thread loop: batch queued rows into one transaction"""
+        while True:
+            item = self._wq.get()
+            batch = []
+            stop = item is None
+            if not stop:
+                batch.append(item)
+                # Pull everything already queued so one BEGIN/COMMIT
+                # covers the burst
+                while True:
+                    try:
+                        item = self._wq.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        stop = True
+                        break
+                    batch.append(item)
+
+            if batch:
+                try:
+                    groups: Dict[str, List[tuple]] = {}
+                    for kind, row in batch:
+                        groups.setdefault(kind, []).append(row)
+                    with self._lock:
+                        cursor = self._conn.cursor()
+                        for kind, rows in groups.items():
+                            cursor.executemany(self._WRITE_SQL[kind], rows)
+                        self._conn.commit()
+                except Exception:
+                    logger.exception("Background write batch failed")
+
+            for _ in range(len(batch) + stop):
+                self._wq.task_done()
+            if stop:
+                return
+
+    def add_conversation_async(
+        self,
+        user_input: str,
+        model_response: Optional[str] = None,
+        model_used: Optional[str] = None,
+        function_called: Optional[str] = None,
+        function_params: Optional[Dict] = None,
+        execution_status: Optional[str] = None,
+        execution_time_ms: float = 0.0,
+        error_message: Optional[str] = None
+    ) -> None:
+        """Queue a conversation entry for the background writer"""
+        self._wq.put(("conversation", (
+            _utcnow(),
+            user_input,
+            model_response,
+            model_used,
+            function_called,
+            _dumps(function_params) if function_params else None,
+            execution_status,
+            execution_time_ms,
+            error_message
+        )))
+
+    def record_metric_async(
+        self,
+        metric_name: str,
+        metric_value: float,
+        tags: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Queue a metric for the background writer"""
+        self._wq.put(("metric", (
+            _utcnow(),
+            metric_name,
+            metric_value,
+            _dumps(tags) if tags else None
+        )))
+
+    def flush_writes(self):
+        """Block until all queued background writes have committed"""
+        self._wq.join()
+
+    def maintenance(self):
+        """Run periodic database upkeep
+
+        Refreshes planner statistics and truncates the WAL file; cheap
+        enough to call from a timer in long-running processes.
+        """
+        with self._lock:
+            self._conn.execute("PRAGMA optimize")
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self):
+        """Stop the writer thread and close the database connection"""
+        if self._writer.is_alive():
+            self._wq.put(None)
+            self._writer.join(timeout=5)
+        with self._lock:
+            try:
+                self._conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
+            self._conn.close()
+
+    def __del__(self):
         try:
-            yield conn
-        finally:
-            conn.close()
-    
+            self._conn.close()
+        except Exception:
+            pass
+
     def init_database(self):
         """Initialize database tables"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            
+
+            # WAL lets readers proceed while a write commits and turns
+            # commits into sequential WAL appends. It persists in the
+            # database file, so setting it once at init is enough
+            # (in-memory databases don't support it)
+            if self.db_path != ":memory:":
+                cursor.execute("PRAGMA journal_mode=WAL")
+                # Bound WAL growth under sustained metric/tool-call writes
+                cursor.execute("PRAGMA wal_autocheckpoint=1000")
+
             # Conversation history table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS conversation (
@@ -100,8 +284,57 @@ class StateManager:
                 )
             """)
             
+            # Full-text index over conversations, kept in sync by
+            # triggers; search becomes an inverted-index probe instead
+            # of a LIKE scan over every row
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='conversation_fts'"
+            )
+            fts_existed = cursor.fetchone() is not None
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS conversation_fts USING fts5(
+                    user_input, model_response,
+                    content='conversation', content_rowid='id'
+                )
+            """)
+            if not fts_existed:
+                # Backfill the index from rows that predate it
+                cursor.execute(
+                    "INSERT INTO conversation_fts(conversation_fts) VALUES('rebuild')"
+                )
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS conversation_ai AFTER INSERT ON conversation BEGIN
+                    INSERT INTO conversation_fts(rowid, user_input, model_response)
+                    VALUES (new.id, new.user_input, new.model_response);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS conversation_ad AFTER DELETE ON conversation BEGIN
+                    INSERT INTO conversation_fts(conversation_fts, rowid, user_input, model_response)
+                    VALUES ('delete', old.id, old.user_input, old.model_response);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS conversation_au AFTER UPDATE ON conversation BEGIN
+                    INSERT INTO conversation_fts(conversation_fts, rowid, user_input, model_response)
+                    VALUES ('delete', old.id, old.user_input, old.model_response);
+                    INSERT INTO conversation_fts(rowid, user_input, model_response)
+                    VALUES (new.id, new.user_input, new.model_response);
+                END
+            """)
+
+            # Indexes matching the hot query predicates, so filtered and
+            # ordered reads become index range scans instead of full
+            # table scans
+            cursor.execute("CREATE INDEX IF NOT EXISTS ix_conv_ts ON conversation(timestamp DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS ix_conv_model_ts ON conversation(model_used, timestamp DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS ix_tool_fn_ts ON tool_calls(function_name, timestamp DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS ix_tool_status_ts ON tool_calls(status, timestamp DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS ix_metrics_name_ts ON metrics(metric_name, timestamp DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS ix_sessions_active_last ON sessions(is_active, last_accessed DESC)")
+
             conn.commit()
-            logger.info(f"Database initialized at {self.db_path}")
+            logger.info("Database initialized at %s", self.db_path)
     
     # ============ Conversation Methods ============
     
@@ -121,16 +354,17 @@ class StateManager:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO conversation (
-                    user_input, model_response, model_used,
+                    timestamp, user_input, model_response, model_used,
                     function_called, function_params,
                     execution_status, execution_time_ms, error_message
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
+                _utcnow(),
                 user_input,
                 model_response,
                 model_used,
                 function_called,
-                json.dumps(function_params) if function_params else None,
+                _dumps(function_params) if function_params else None,
                 execution_status,
                 execution_time_ms,
                 error_message
@@ -138,6 +372,42 @@ class StateManager:
             conn.commit()
             return cursor.lastrowid
     
+    def add_conversations_bulk(self, entries: List[Dict[str, Any]]) -> None:
+        """Add many conversation entries in one transaction
+
+        Each entry mirrors the add_conversation keyword arguments. One
+        executemany + commit instead of a commit per row.
+        """
+        if not entries:
+            return
+
+        now = _utcnow()
+        rows = [
+            (
+                now,
+                entry.get("user_input"),
+                entry.get("model_response"),
+                entry.get("model_used"),
+                entry.get("function_called"),
+                _dumps(entry["function_params"]) if entry.get("function_params") else None,
+                entry.get("execution_status"),
+                entry.get("execution_time_ms", 0.0),
+                entry.get("error_message")
+            )
+            for entry in entries
+        ]
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO conversation (
+                    timestamp, user_input, model_response, model_used,
+                    function_called, function_params,
+                    execution_status, execution_time_ms, error_message
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            conn.commit()
+
     def get_conversation_history(
         self,
         limit: int = 50,
@@ -157,36 +427,41 @@ class StateManager:
             
             query += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
             params.extend([limit, offset])
-            
+
             cursor.execute(query, params)
-            
-            return [dict(row) for row in cursor.fetchall()]
+
+            keys = [d[0] for d in cursor.description]
+            return [dict(zip(keys, row)) for row in cursor]
     
     def search_conversations(self, keyword: str, limit: int = 20) -> List[Dict[str, Any]]:
-        """Search conversations by keyword"""
+        """Search conversations by keyword via the full-text index"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            # Quote the keyword so FTS operators in user text are treated
+            # literally
             cursor.execute("""
-                SELECT * FROM conversation
-                WHERE user_input LIKE ? OR model_response LIKE ?
-                ORDER BY timestamp DESC
+                SELECT c.* FROM conversation c
+                JOIN conversation_fts f ON f.rowid = c.id
+                WHERE conversation_fts MATCH ?
+                ORDER BY rank
                 LIMIT ?
-            """, (f"%{keyword}%", f"%{keyword}%", limit))
-            
+            """, ('"%s"' % keyword.replace('"', '""'), limit))
+
             return [dict(row) for row in cursor.fetchall()]
     
     def clear_old_conversations(self, days: int = 30):
         """Delete conversations older than N days"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cutoff_date = datetime.now() - timedelta(days=days)
+            # Let SQLite compute the cutoff: stays in the stored UTC
+            # timestamp domain and keeps the comparison index-friendly
             cursor.execute(
-                "DELETE FROM conversation WHERE timestamp < ?",
-                (cutoff_date.isoformat(),)
+                "DELETE FROM conversation WHERE timestamp < datetime('now', ?)",
+                (f"-{days} days",)
             )
             conn.commit()
             deleted = cursor.rowcount
-            logger.info(f"Deleted {deleted} old conversations")
+            logger.info("Deleted %d old conversations", deleted)
     
     # ============ Tool Call Methods ============
     
@@ -205,21 +480,56 @@ class StateManager:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO tool_calls (
-                    function_name, params, status, result, error,
+                    timestamp, function_name, params, status, result, error,
                     execution_time_ms, attempts
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """, (
+                _utcnow(),
                 function_name,
-                json.dumps(params) if params else None,
+                _dumps(params) if params else None,
                 status,
-                json.dumps(result) if result else None,
+                _dumps(result) if result else None,
                 error,
                 execution_time_ms,
                 attempts
             ))
             conn.commit()
             return cursor.lastrowid
-    
+
+    def add_tool_calls_bulk(self, calls: List[Dict[str, Any]]) -> None:
+        """Record many tool call executions in one transaction
+
+        Each entry mirrors the add_tool_call keyword arguments. One
+        executemany + commit instead of a commit per call.
+        """
+        if not calls:
+            return
+
+        now = _utcnow()
+        rows = [
+            (
+                now,
+                call.get("function_name"),
+                _dumps(call["params"]) if call.get("params") else None,
+                call.get("status", "pending"),
+                _dumps(call["result"]) if call.get("result") else None,
+                call.get("error"),
+                call.get("execution_time_ms", 0.0),
+                call.get("attempts", 1)
+            )
+            for call in calls
+        ]
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO tool_calls (
+                    timestamp, function_name, params, status, result, error,
+                    execution_time_ms, attempts
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            conn.commit()
+
     def get_tool_calls(
         self,
         function_name: Optional[str] = None,
@@ -243,44 +553,40 @@ class StateManager:
             
             query += " ORDER BY timestamp DESC LIMIT ?"
             params.append(limit)
-            
+
             cursor.execute(query, params)
-            
-            results = []
-            for row in cursor.fetchall():
-                row_dict = dict(row)
-                if row_dict["params"]:
-                    row_dict["params"] = json.loads(row_dict["params"])
-                if row_dict["result"]:
-                    row_dict["result"] = json.loads(row_dict["result"])
-                results.append(row_dict)
-            
-            return results
+
+            keys = [d[0] for d in cursor.description]
+            return [
+                {
+                    k: (_loads(v) if v and k in ("params", "result") else v)
+                    for k, v in zip(keys, row)
+                }
+                for row in cursor
+            ]
     
     def get_tool_statistics(self) -> Dict[str, Any]:
         """Get tool call statistics"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            # Total calls
-            cursor.execute("SELECT COUNT(*) FROM tool_calls")
-            total = cursor.fetchone()[0]
-            
+            # Totals, success count, and average in one table scan via
+            # conditional aggregation
+            cursor.execute("""
+                SELECT COUNT(*), COALESCE(SUM(status = 'success'), 0),
+                       AVG(execution_time_ms)
+                FROM tool_calls
+            """)
+            total, successful, avg_time = cursor.fetchone()
+            avg_time = avg_time or 0
+
             # By status
             cursor.execute("""
                 SELECT status, COUNT(*) FROM tool_calls
                 GROUP BY status
             """)
             by_status = {row[0]: row[1] for row in cursor.fetchall()}
-            
-            # Success rate
-            cursor.execute("SELECT COUNT(*) FROM tool_calls WHERE status = 'success'")
-            successful = cursor.fetchone()[0]
-            
-            # Average execution time
-            cursor.execute("SELECT AVG(execution_time_ms) FROM tool_calls")
-            avg_time = cursor.fetchone()[0] or 0
-            
+
             # Most used functions
             cursor.execute("""
                 SELECT function_name, COUNT(*) FROM tool_calls
@@ -289,7 +595,7 @@ class StateManager:
                 LIMIT 5
             """)
             most_used = [(row[0], row[1]) for row in cursor.fetchall()]
-            
+
             return {
                 "total_calls": total,
                 "by_status": by_status,
@@ -304,42 +610,49 @@ class StateManager:
         """Set user preference"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            value_str = json.dumps(value) if not isinstance(value, str) else value
+            value_str = _dumps(value) if not isinstance(value, str) else value
             cursor.execute("""
                 INSERT OR REPLACE INTO preferences (key, value, updated_at)
                 VALUES (?, ?, CURRENT_TIMESTAMP)
             """, (key, value_str))
             conn.commit()
-            logger.info(f"Preference saved: {key} = {value}")
-    
+            self._pref_cache[key] = value
+            logger.info("Preference saved: %s = %s", key, value)
+
     def get_preference(self, key: str, default: Any = None) -> Any:
-        """Get user preference"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        """Get user preference (cached after first read)"""
+        with self._lock:
+            if key in self._pref_cache:
+                return self._pref_cache[key]
+
+            cursor = self._conn.cursor()
             cursor.execute("SELECT value FROM preferences WHERE key = ?", (key,))
             row = cursor.fetchone()
-            
+
             if row:
                 try:
-                    return json.loads(row[0])
-                except json.JSONDecodeError:
-                    return row[0]
+                    value = _loads(row[0])
+                except ValueError:
+                    value = row[0]
+                self._pref_cache[key] = value
+                return value
             return default
-    
+
     def get_all_preferences(self) -> Dict[str, Any]:
-        """Get all preferences"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT key, value FROM preferences")
-            
-            result = {}
-            for row in cursor.fetchall():
-                try:
-                    result[row[0]] = json.loads(row[1])
-                except json.JSONDecodeError:
-                    result[row[0]] = row[1]
-            
-            return result
+        """Get all preferences (served from cache after a one-shot load)"""
+        with self._lock:
+            if not self._pref_cache_complete:
+                cursor = self._conn.cursor()
+                cursor.execute("SELECT key, value FROM preferences")
+
+                for row in cursor.fetchall():
+                    try:
+                        self._pref_cache[row[0]] = _loads(row[1])
+                    except ValueError:
+                        self._pref_cache[row[0]] = row[1]
+                self._pref_cache_complete = True
+
+            return self._pref_cache.copy()
     
     # ============ Metric Methods ============
     
@@ -353,15 +666,40 @@ class StateManager:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                INSERT INTO metrics (metric_name, metric_value, tags)
-                VALUES (?, ?, ?)
+                INSERT INTO metrics (timestamp, metric_name, metric_value, tags)
+                VALUES (?, ?, ?, ?)
             """, (
+                _utcnow(),
                 metric_name,
                 metric_value,
-                json.dumps(tags) if tags else None
+                _dumps(tags) if tags else None
             ))
             conn.commit()
     
+    def record_metrics_bulk(self, rows: List[Any]) -> None:
+        """Record many metrics in one transaction
+
+        Each row is a (metric_name, metric_value, tags) tuple; tags may
+        be None. JSON is serialized up front so the executemany loop
+        stays in the driver.
+        """
+        if not rows:
+            return
+
+        now = _utcnow()
+        prepared = [
+            (now, name, value, _dumps(tags) if tags else None)
+            for name, value, tags in rows
+        ]
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO metrics (timestamp, metric_name, metric_value, tags)
+                VALUES (?, ?, ?, ?)
+            """, prepared)
+            conn.commit()
+
     def get_metrics(
         self,
         metric_name: Optional[str] = None,
@@ -372,10 +710,8 @@ class StateManager:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            cutoff_time = datetime.now() - timedelta(hours=hours)
-            
-            query = "SELECT * FROM metrics WHERE timestamp > ?"
-            params = [cutoff_time.isoformat()]
+            query = "SELECT * FROM metrics WHERE timestamp > datetime('now', ?)"
+            params = [f"-{hours} hours"]
             
             if metric_name:
                 query += " AND metric_name = ?"
@@ -383,18 +719,48 @@ class StateManager:
             
             query += " ORDER BY timestamp DESC LIMIT ?"
             params.append(limit)
-            
+
             cursor.execute(query, params)
-            
-            results = []
-            for row in cursor.fetchall():
-                row_dict = dict(row)
-                if row_dict["tags"]:
-                    row_dict["tags"] = json.loads(row_dict["tags"])
-                results.append(row_dict)
-            
-            return results
+
+            keys = [d[0] for d in cursor.description]
+            return [
+                {k: (_loads(v) if k == "tags" and v else v) for k, v in zip(keys, row)}
+                for row in cursor
+            ]
     
+    def get_metrics_by_tag(
+        self,
+        tag_key: str,
+        tag_value: str,
+        metric_name: Optional[str] = None,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Get metrics whose tags JSON has tag_key == tag_value
+
+        Filtering happens in-engine via json_extract, so non-matching
+        rows are never materialized in Python.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+
+            query = "SELECT * FROM metrics WHERE json_extract(tags, ?) = ?"
+            params = [f"$.{tag_key}", tag_value]
+
+            if metric_name:
+                query += " AND metric_name = ?"
+                params.append(metric_name)
+
+            query += " ORDER BY timestamp DESC LIMIT ?"
+            params.append(limit)
+
+            cursor.execute(query, params)
+
+            keys = [d[0] for d in cursor.description]
+            return [
+                {k: (_loads(v) if k == "tags" and v else v) for k, v in zip(keys, row)}
+                for row in cursor
+            ]
+
     # ============ Session Methods ============
     
     def create_session(
@@ -411,13 +777,13 @@ class StateManager:
                     VALUES (?, ?, 1)
                 """, (
                     session_name,
-                    json.dumps(metadata) if metadata else None
+                    _dumps(metadata) if metadata else None
                 ))
                 conn.commit()
-                logger.info(f"Session created: {session_name}")
+                logger.info("Session created: %s", session_name)
                 return cursor.lastrowid
             except sqlite3.IntegrityError:
-                logger.warning(f"Session already exists: {session_name}")
+                logger.warning("Session already exists: %s", session_name)
                 return None
     
     def list_sessions(self, active_only: bool = True) -> List[Dict[str, Any]]:
@@ -426,23 +792,22 @@ class StateManager:
             cursor = conn.cursor()
             
             query = "SELECT * FROM sessions"
-            params = []
-            
+
             if active_only:
                 query += " WHERE is_active = 1"
-            
+
             query += " ORDER BY last_accessed DESC"
-            
-            cursor.execute(query, params)
-            
-            results = []
-            for row in cursor.fetchall():
-                row_dict = dict(row)
-                if row_dict["metadata"]:
-                    row_dict["metadata"] = json.loads(row_dict["metadata"])
-                results.append(row_dict)
-            
-            return results
+
+            cursor.execute(query)
+
+            # Stream rows off the cursor and build each dict in one
+            # comprehension - no fetchall materialization or dict(row)
+            # intermediate copy
+            keys = [d[0] for d in cursor.description]
+            return [
+                {k: (_loads(v) if k == "metadata" and v else v) for k, v in zip(keys, row)}
+                for row in cursor
+            ]
     
     def delete_session(self, session_name: str):
         """Delete session"""
@@ -453,21 +818,22 @@ class StateManager:
                 (session_name,)
             )
             conn.commit()
-            logger.info(f"Session deleted: {session_name}")
+            logger.info("Session deleted: %s", session_name)
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get overall statistics"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            # Conversation count
-            cursor.execute("SELECT COUNT(*) FROM conversation")
-            conversations = cursor.fetchone()[0]
-            
+            # Conversation count and average response time in one scan
+            cursor.execute("SELECT COUNT(*), AVG(execution_time_ms) FROM conversation")
+            conversations, avg_response_time = cursor.fetchone()
+            avg_response_time = avg_response_time or 0
+
             # Tool calls count
             cursor.execute("SELECT COUNT(*) FROM tool_calls")
             tool_calls = cursor.fetchone()[0]
-            
+
             # Models used
             cursor.execute("""
                 SELECT model_used, COUNT(*) FROM conversation
@@ -475,11 +841,7 @@ class StateManager:
                 GROUP BY model_used
             """)
             models = {row[0]: row[1] for row in cursor.fetchall()}
-            
-            # Average response time
-            cursor.execute("SELECT AVG(execution_time_ms) FROM conversation")
-            avg_response_time = cursor.fetchone()[0] or 0
-            
+
             return {
                 "total_conversations": conversations,
                 "total_tool_calls": tool_calls,
@@ -487,21 +849,48 @@ class StateManager:
                 "avg_response_time_ms": avg_response_time
             }
     
+    # Large tables streamed row-by-row on export: (json_key, table, order)
+    _EXPORT_TABLES = (
+        ("conversations", "conversation", "timestamp DESC"),
+        ("tool_calls", "tool_calls", "timestamp DESC"),
+        ("sessions", "sessions", "last_accessed DESC"),
+    )
+
     def export_data(self, export_path: str = "export.json"):
-        """Export all data to JSON"""
-        data = {
-            "exported_at": datetime.now().isoformat(),
-            "conversations": self.get_conversation_history(limit=10000),
-            "tool_calls": self.get_tool_calls(limit=10000),
-            "preferences": self.get_all_preferences(),
-            "sessions": self.list_sessions(active_only=False),
-            "statistics": self.get_statistics()
-        }
-        
-        with open(export_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-        
-        logger.info(f"Data exported to {export_path}")
+        """Export all data to JSON, streaming large tables row-by-row
+
+        Rows are written as they come off the cursor, so peak memory
+        stays flat no matter how big the tables are.
+        """
+        if orjson is not None:
+            def row_dumps(obj):
+                return orjson.dumps(obj, default=str).decode()
+        else:
+            def row_dumps(obj):
+                return json.dumps(obj, ensure_ascii=False, default=str)
+
+        with open(export_path, 'w', encoding='utf-8') as f, self.get_connection() as conn:
+            cursor = conn.cursor()
+
+            f.write('{"exported_at": %s' % row_dumps(datetime.now().isoformat()))
+
+            for json_key, table, order in self._EXPORT_TABLES:
+                f.write(', "%s": [' % json_key)
+                cursor.execute(f"SELECT * FROM {table} ORDER BY {order}")
+                keys = [d[0] for d in cursor.description]
+                first = True
+                for row in cursor:
+                    if not first:
+                        f.write(',\n')
+                    first = False
+                    f.write(row_dumps(dict(zip(keys, row))))
+                f.write(']')
+
+            f.write(', "preferences": ' + row_dumps(self.get_all_preferences()))
+            f.write(', "statistics": ' + row_dumps(self.get_statistics()))
+            f.write('}')
+
+        logger.info("Data exported to %s", export_path)
         return export_path
     
     def clear_all_data(self, confirm: bool = False):
@@ -518,5 +907,7 @@ class StateManager:
             cursor.execute("DELETE FROM metrics")
             cursor.execute("DELETE FROM sessions")
             conn.commit()
+            self._pref_cache.clear()
+            self._pref_cache_complete = False
             logger.warning("All data cleared")
             return True
@@ -3,15 +3,27 @@ Streaming Handler - Handles streaming responses from Ollama
 Processes real-time streaming responses from the Ollama AI model
 """
 
+import io
 import requests
 import json
 import logging
+import re
 from typing import Generator, Optional, Callable, Dict, Any
 from datetime import datetime
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Final-pass extraction pattern, compiled once at module scope
+_FINAL_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Optional C JSON codec for decoding the small per-token NDJSON frames
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 
 class StreamingHandler:
     """Handles streaming responses from Ollama"""
@@ -19,6 +31,11 @@ class StreamingHandler:
     def __init__(self, base_url: str = "http://localhost:11434"):
         self.base_url = base_url
         self.stream_active = False
+        # Keep-alive pooling: reuse the TCP connection across streams
+        # instead of a handshake per generation
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("http://", adapter)
     
     def stream_generate(
         self,
@@ -56,9 +73,9 @@ class StreamingHandler:
         self.stream_active = True
         
         try:
-            logger.info(f"Starting stream for model: {model}")
+            logger.info("Starting stream for model: %s", model)
             
-            response = requests.post(
+            response = self._session.post(
                 url,
                 json=payload,
                 stream=True,
@@ -66,41 +83,56 @@ class StreamingHandler:
             )
             response.raise_for_status()
             
-            for line in response.iter_lines():
-                if not self.stream_active:
+            # Read raw chunks and split NDJSON frames on bytes ourselves -
+            # iter_lines scans byte-by-byte in Python and re-copies each
+            # line, which dominates per-token overhead
+            buf = bytearray()
+            done = False
+
+            for data in response.iter_content(chunk_size=8192):
+                if done or not self.stream_active:
                     break
-                
-                if line:
+                if not data:
+                    continue
+
+                buf += data
+                while (nl := buf.find(b"\n")) != -1:
+                    line = bytes(buf[:nl])
+                    del buf[:nl + 1]
+                    if not line:
+                        continue
                     try:
-                        chunk = json.loads(line)
-                        token = chunk.get("response", "")
-                        
-                        if token:
-                            full_response.append(token)
-                            
-                            # Call token callback
-                            if on_token:
-                                on_token(token)
-                            
-                            # Yield token
-                            yield token
-                        
-                        # Check if done
-                        if chunk.get("done", False):
-                            break
-                            
-                    except json.JSONDecodeError as e:
+                        chunk = _json_loads(line)
+                    except ValueError as e:
                         error_msg = f"JSON decode error: {str(e)}"
                         logger.error(error_msg)
                         if on_error:
                             on_error(error_msg)
+                        continue
+
+                    token = chunk.get("response", "")
+
+                    if token:
+                        full_response.append(token)
+
+                        # Call token callback
+                        if on_token:
+                            on_token(token)
+
+                        # Yield token
+                        yield token
+
+                    # Check if done
+                    if chunk.get("done", False):
+                        done = True
+                        break
             
             # Call completion callback
             full_text = "".join(full_response)
             if on_complete:
                 on_complete(full_text)
             
-            logger.info(f"Stream completed. Response length: {len(full_text)}")
+            logger.info("Stream completed. Response length: %d", len(full_text))
             
         except requests.RequestException as e:
             error_msg = f"Request error: {str(e)}"
@@ -130,49 +162,65 @@ class StreamingHandler:
         Returns:
             Complete parsed JSON object or None if parsing failed
         """
-        buffer = ""
         complete_json = None
-        
+
+        # Incremental brace-depth parser: each token is scanned once, so
+        # the per-token cost is O(len(token)) instead of re-searching the
+        # whole buffer, and nested objects are handled correctly
+        depth = 0
+        in_string = False
+        escape = False
+        obj_chars = []
+
         def on_token(token: str):
-            nonlocal buffer, complete_json
-            buffer += token
-            
-            # Try to parse complete JSON objects in buffer
-            try:
-                # Look for complete JSON object
-                import re
-                json_match = re.search(r'\{[^{}]*\}', buffer)
-                if json_match:
-                    json_str = json_match.group(0)
-                    obj = json.loads(json_str)
-                    complete_json = obj
-                    
-                    if on_json_chunk:
-                        on_json_chunk(obj)
-                    
-                    logger.debug(f"Parsed JSON chunk: {obj}")
-            except (json.JSONDecodeError, AttributeError):
-                pass
-        
+            nonlocal complete_json, depth, in_string, escape
+            for ch in token:
+                if depth == 0 and not obj_chars:
+                    if ch != '{':
+                        continue
+                obj_chars.append(ch)
+                if escape:
+                    escape = False
+                elif ch == '\\':
+                    escape = True
+                elif ch == '"':
+                    in_string = not in_string
+                elif not in_string:
+                    if ch == '{':
+                        depth += 1
+                    elif ch == '}':
+                        depth -= 1
+                        if depth == 0:
+                            try:
+                                obj = json.loads("".join(obj_chars))
+                            except json.JSONDecodeError:
+                                pass
+                            else:
+                                complete_json = obj
+                                if on_json_chunk:
+                                    on_json_chunk(obj)
+                                logger.debug("Parsed JSON chunk: %s", obj)
+                            obj_chars.clear()
+
         # Consume stream
-        response_text = ""
+        response_parts = []
         for token in self.stream_generate(
             model,
             prompt,
             on_token=on_token,
             **kwargs
         ):
-            response_text += token
-        
+            response_parts.append(token)
+
         # Final attempt to parse complete JSON
-        try:
-            import re
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                complete_json = json.loads(json_match.group(0))
-        except (json.JSONDecodeError, AttributeError):
-            pass
-        
+        if complete_json is None:
+            try:
+                json_match = _FINAL_JSON_RE.search("".join(response_parts))
+                if json_match:
+                    complete_json = json.loads(json_match.group(0))
+            except json.JSONDecodeError:
+                pass
+
         return complete_json
     
     def stop_stream(self):
@@ -182,46 +230,57 @@ class StreamingHandler:
 
 
 class StreamBuffer:
-    """Buffer for accumulating stream tokens with callbacks"""
-    
+    """Buffer for accumulating stream tokens with callbacks
+
+    Tokens are written once into a contiguous StringIO instead of being
+    held in a list and re-joined at every callback boundary.
+    """
+
     def __init__(self, callback_interval: int = 5):
         """
         Initialize buffer
-        
+
         Args:
             callback_interval: Call on_buffer_full after N tokens
         """
-        self.buffer = []
+        self._buf = io.StringIO()
+        self._count = 0
         self.callback_interval = callback_interval
         self.on_buffer_full = None
         self.on_complete = None
-    
+
+    def _drain(self) -> str:
+        """Return buffered content and reset the buffer"""
+        chunk = self._buf.getvalue()
+        self._buf.seek(0)
+        self._buf.truncate(0)
+        self._count = 0
+        return chunk
+
     def add_token(self, token: str):
         """Add token to buffer"""
-        self.buffer.append(token)
-        
-        if len(self.buffer) >= self.callback_interval and self.on_buffer_full:
-            chunk = "".join(self.buffer)
-            self.on_buffer_full(chunk)
-            self.buffer.clear()
-    
+        self._buf.write(token)
+        self._count += 1
+
+        if self._count >= self.callback_interval and self.on_buffer_full:
+            self.on_buffer_full(self._drain())
+
     def flush(self):
         """Flush remaining tokens"""
-        if self.buffer:
-            chunk = "".join(self.buffer)
+        if self._count:
+            chunk = self._drain()
             if self.on_complete:
                 self.on_complete(chunk)
             else:
-                logger.info(f"Flushed: {chunk}")
-            self.buffer.clear()
-    
+                logger.info("Flushed: %s", chunk)
+
     def get_content(self) -> str:
         """Get all buffered content"""
-        return "".join(self.buffer)
-    
+        return self._buf.getvalue()
+
     def clear(self):
         """Clear buffer"""
-        self.buffer.clear()
+        self._drain()
 
 
 class StreamClient:
@@ -235,7 +294,7 @@ class StreamClient:
     def register_callback(self, event: str, callback: Callable):
         """Register callback for events: token, complete, error, json_chunk"""
         self.callbacks[event] = callback
-        logger.info(f"Registered callback for event: {event}")
+        logger.info("Registered callback for event: %s", event)
     
     def generate(self, model: str, prompt: str, **kwargs) -> str:
         """
@@ -244,12 +303,14 @@ class StreamClient:
         Returns:
             Complete response text
         """
-        full_response = []
-        
+        # Single accumulation buffer; the token text is written once here
+        # instead of into a parallel list joined at the end
+        collected = io.StringIO()
+
         def on_token(token: str):
-            full_response.append(token)
+            collected.write(token)
             self.buffer.add_token(token)
-            
+
             if "token" in self.callbacks:
                 self.callbacks["token"](token)
         
@@ -273,8 +334,8 @@ class StreamClient:
             **kwargs
         ):
             pass
-        
-        return "".join(full_response)
+
+        return collected.getvalue()
     
     def generate_json(self, model: str, prompt: str, **kwargs) -> Optional[Dict[str, Any]]:
         """Generate JSON with streaming"""
@@ -1,23 +1,483 @@
+import base64
+import functools
 import os
 import ctypes
 import subprocess
 import json
+import math
+import platform
+import re
+import socket
+import sched
+import struct
 import threading
 import time
+import types
 from typing import Dict, Any, Callable
 from PIL import Image, ImageDraw
 import tempfile
 from pathlib import Path
 import sys
 import shutil
+import winreg
 import winsound
 
+# Optional in-process WinRT toast bindings - showing a toast through
+# these is a COM call instead of a fresh powershell.exe per notification
+try:
+    from winsdk.windows.ui.notifications import ToastNotificationManager, ToastNotification
+    from winsdk.windows.data.xml.dom import XmlDocument
+except ImportError:
+    ToastNotificationManager = None
+
+# Toast payload templates built once - the fire path only formats in the
+# title/message instead of reassembling the XML (or the escaped
+# PowerShell one-liner) per notification
+_TOAST_XML_TEMPLATE = (
+    '<toast><visual><binding template="ToastText02">'
+    '<text id="1">{}</text><text id="2">{}</text>'
+    '</binding></visual></toast>')
+
+_TOAST_PS_TEMPLATE = (
+    '[Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime] > $null; '
+    '$APP_ID = "TimerApp"; '
+    '[Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier($APP_ID).Show([Windows.UI.Notifications.ToastNotification]'
+    '(New-Object Windows.Data.Xml.Dom.XmlDocument).LoadXml(@"<toast><visual><binding template=\\"ToastText02\\">'
+    '<text id=\\"1\\">{}</text><text id=\\"2\\">{}</text>'
+    '</binding></visual></toast>@"))')
+
+# Win32 entry points resolved once with signatures set - avoids the
+# per-call windll attribute walk and prototype lookup
+_user32 = ctypes.windll.user32
+_SystemParametersInfoW = _user32.SystemParametersInfoW
+_SystemParametersInfoW.argtypes = (ctypes.c_uint, ctypes.c_uint, ctypes.c_wchar_p, ctypes.c_uint)
+_SystemParametersInfoW.restype = ctypes.c_int
+_SetSysColors = _user32.SetSysColors
+
+# Color tables built once at import - convert_color_name_to_hex is called
+# on every change_background and used to rebuild the dict per call
+_COLOR_HEX = types.MappingProxyType({
+    "white": "#FFFFFF",
+    "black": "#000000",
+    "blue": "#0000FF",
+    "red": "#FF0000",
+    "green": "#00FF00",
+    "yellow": "#FFFF00",
+    "orange": "#FFA500",
+    "purple": "#800080",
+    "pink": "#FFC0CB",
+    "dark": "#1a1a1a",
+    "light": "#F5F5F5",
+    "gray": "#808080",
+    "cyan": "#00FFFF",
+    "magenta": "#FF00FF",
+})
+
+# Explicit aliases instead of the old substring scan, which mis-mapped
+# names like "darkred" to the "dark" entry
+_COLOR_ALIASES = {
+    "grey": "gray",
+    "violet": "purple",
+    "navy": "blue",
+}
+
+# Launch dispatch tables, keyed by lowercase name and built once at
+# import - open_application and the settings openers used to rebuild
+# these dicts on every call
+_APPS = types.MappingProxyType({
+    # Microsoft Built-in Apps
+    "notepad": "notepad.exe",
+    "notepad++": "notepad++",
+    "calculator": "calc.exe",
+    "calc": "calc.exe",
+    "paint": "mspaint.exe",
+    "mspaint": "mspaint.exe",
+    "explorer": "explorer.exe",
+    "file explorer": "explorer.exe",
+    "file": "explorer.exe",
+    "files": "explorer.exe",
+    "powershell": "powershell.exe",
+    "powershell ise": "powershell_ise.exe",
+    "cmd": "cmd.exe",
+    "command prompt": "cmd.exe",
+    "terminal": "cmd.exe",
+    "settings": "ms-settings:",
+    "control panel": "control.exe",
+    "device manager": "devmgmt.msc",
+    "task manager": "taskmgr.exe",
+    "disk management": "diskmgmt.msc",
+    
+    # Development Tools
+    "jupyter": "jupyter notebook",
+    "notebook": "jupyter notebook",
+    "jupyter notebook": "jupyter notebook",
+    "jupyter lab": "jupyter lab",
+    "lab": "jupyter lab",
+    "vscode": "code",
+    "vs code": "code",
+    "visual studio": "devenv.exe",
+    "python": "python",
+    
+    # Office Applications
+    "word": "winword.exe",
+    "excel": "excel.exe",
+    "powerpoint": "powerpnt.exe",
+    "outlook": "outlook.exe",
+    "access": "msaccess.exe",
+    "publisher": "mspub.exe",
+    
+    # Browsers
+    "chrome": "chrome.exe",
+    "google chrome": "chrome.exe",
+    "firefox": "firefox.exe",
+    "mozilla firefox": "firefox.exe",
+    "edge": "msedge.exe",
+    "internet explorer": "iexplore.exe",
+    "ie": "iexplore.exe",
+    "opera": "opera.exe",
+    
+    # Media & Entertainment
+    "vlc": "vlc.exe",
+    "media player": "wmplayer.exe",
+    "groove": "groove.exe",
+    "movies": "WinMoviesApp.exe",
+    "photos": "PhotosApp.exe",
+    
+    # Utilities
+    "snipping tool": "SnippingTool.exe",
+    "screenshot": "SnippingTool.exe",
+    "clipboard": "clipbrd.exe",
+    "character map": "charmap.exe",
+    "system information": "msinfo32.exe",
+    "resource monitor": "resmon.exe",
+    "performance monitor": "perfmon.exe",
+    "registry editor": "regedit.exe",
+    "regedit": "regedit.exe",
+    "disk cleanup": "cleanmgr.exe",
+    "winrar": "WinRAR.exe",
+    "7zip": "7zFM.exe",
+})
+
+_NOTEBOOK_KEYS = frozenset({"jupyter", "notebook", "jupyter notebook", "jupyter lab", "lab"})
+
+# Keyword set for fire-and-forget Popen launches: DEVNULL streams skip
+# pipe allocation, close_fds=False skips inheritable-handle duplication,
+# and no console window is created
+# systeminfo fallback parse: one compiled alternation scan over the output
+# instead of seven substring tests per line
+_SYSTEMINFO_RE = re.compile(
+    r'^(OS Name|OS Version|System Boot Time|Total Physical Memory|'
+    r'Available Physical Memory|Processor\(s\)|System Type):\s*(.+)$',
+    re.MULTILINE)
+_SYSTEMINFO_KEYS = types.MappingProxyType({
+    "OS Name": "OS_Name",
+    "OS Version": "OS_Version",
+    "System Boot Time": "Boot_Time",
+    "Total Physical Memory": "Total_RAM",
+    "Available Physical Memory": "Available_RAM",
+    "Processor(s)": "Processor_Count",
+    "System Type": "System_Type",
+})
+
+
+class _MEMORYSTATUSEX(ctypes.Structure):
+    """Layout for kernel32 GlobalMemoryStatusEx"""
+    _fields_ = [
+        ("dwLength", ctypes.c_uint32),
+        ("dwMemoryLoad", ctypes.c_uint32),
+        ("ullTotalPhys", ctypes.c_uint64),
+        ("ullAvailPhys", ctypes.c_uint64),
+        ("ullTotalPageFile", ctypes.c_uint64),
+        ("ullAvailPageFile", ctypes.c_uint64),
+        ("ullTotalVirtual", ctypes.c_uint64),
+        ("ullAvailVirtual", ctypes.c_uint64),
+        ("ullAvailExtendedVirtual", ctypes.c_uint64),
+    ]
+
+
+def _memory_status():
+    """Return (total, available) physical RAM in bytes via a direct syscall"""
+    status = _MEMORYSTATUSEX()
+    status.dwLength = ctypes.sizeof(status)
+    if not ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+        raise ctypes.WinError()
+    return status.ullTotalPhys, status.ullAvailPhys
+
+
+_POPEN_KW = dict(
+    stdin=subprocess.DEVNULL,
+    stdout=subprocess.DEVNULL,
+    stderr=subprocess.DEVNULL,
+    close_fds=False,
+    creationflags=subprocess.CREATE_NO_WINDOW,
+)
+
+# Argv prefix for one-shot PowerShell runs: skipping profile scripts and the
+# logo banner trims a large slice off the ~300 ms interpreter cold start.
+# -EncodedCommand takes the script as UTF-16LE base64, so quotes and
+# backslashes reach PowerShell verbatim with no CMD/parser escaping stage
+_PS_ONESHOT = ('powershell', '-NoProfile', '-NonInteractive', '-NoLogo',
+               '-EncodedCommand')
+
+
+def _normalize_hex(color: str):
+    """Normalize a hex color to ("#RRGGBB", (r, g, b)), or None if invalid
+
+    Validating up front keeps malformed input from silently rendering an
+    all-black wallpaper further down the line.
+    """
+    c = color.strip().strip('\'"')
+    if c.startswith(('0x', '0X')):
+        c = c[2:]
+    elif c.startswith('#'):
+        c = c[1:]
+    else:
+        return None
+    if len(c) != 6:
+        return None
+    try:
+        value = int(c, 16)
+    except ValueError:
+        return None
+    return "#" + c.upper(), (value >> 16, (value >> 8) & 0xFF, value & 0xFF)
+
+
+def _classify_app(command: str):
+    """Classify a launch command so open_application can dispatch directly
+
+    Known names resolve to exactly one launch strategy instead of walking
+    the generic Popen fallback ladder (which costs a wasted process spawn
+    per rung).
+    """
+    if command.endswith(":"):
+        return ("uri", command)
+    if command == "jupyter notebook":
+        return ("pymod", "notebook")
+    if command == "jupyter lab":
+        return ("pymod", "jupyterlab")
+    if " " in command:
+        return ("shell", command)
+    return ("exe", command)
+
+
+_APPS_TYPED = {name: _classify_app(cmd) for name, cmd in _APPS.items()}
+
+# Text descriptions of volume levels, shared by set_volume/control_volume
+_VOLUME_LEVEL_MAP = types.MappingProxyType({
+    'off': 0, 'mute': 0, 'silent': 0,
+    'low': 25, 'quiet': 25, 'soft': 25,
+    'mid': 50, 'middle': 50, 'medium': 50, 'normal': 50,
+    'high': 75, 'loud': 75, 'volume': 75, 'up': 75,
+    'max': 100, 'maximum': 100, 'full': 100, 'highest': 100, 'loudest': 100
+})
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_exe(name: str):
+    """Resolve an executable on PATH, cached - PATH is static per process"""
+    return shutil.which(name)
+
+
+def _render_timer_beep() -> bytes:
+    """Render the timer chime (three 1 kHz tones) as an in-memory WAV
+
+    Played with SND_MEMORY|SND_ASYNC so the scheduler thread is not
+    blocked for the 1.5 s the old back-to-back winsound.Beep calls took.
+    """
+    rate = 22050
+    tone = b"".join(
+        struct.pack("<h", int(12000 * math.sin(2 * math.pi * 1000 * i / rate)))
+        for i in range(rate // 2))
+    gap = b"\x00\x00" * (rate // 10)
+    pcm = tone + gap + tone + gap + tone
+    header = struct.pack("<4sI4s4sIHHIIHH4sI", b"RIFF", 36 + len(pcm), b"WAVE",
+                         b"fmt ", 16, 1, 1, rate, rate * 2, 2, 16,
+                         b"data", len(pcm))
+    return header + pcm
+
+
+_TIMER_BEEP_WAV = _render_timer_beep()
+
+
+_SETTINGS_COMMANDS = types.MappingProxyType({
+    # General Settings
+    "settings": "ms-settings:",
+    "general": "ms-settings:",
+    
+    # Display & Visual Settings
+    "display": "ms-settings:display",
+    "screen": "ms-settings:display",
+    "resolution": "ms-settings:display-advanced",
+    "wallpaper": "ms-settings:personalization-background",
+    "background": "ms-settings:personalization-background",
+    "desktop": "ms-settings:personalization-background",
+    "theme": "ms-settings:themes",
+    "dark mode": "ms-settings:themes",
+    "light mode": "ms-settings:themes",
+    "personalization": "ms-settings:personalization",
+    "colors": "ms-settings:personalization-colors",
+    "start": "ms-settings:personalization-start",
+    "taskbar": "ms-settings:personalization-taskbar",
+    "lock screen": "ms-settings:lockscreen",
+    
+    # Sound Settings
+    "sound": "ms-settings:sound",
+    "volume": "ms-settings:sound",
+    "audio": "ms-settings:sound",
+    "microphone": "ms-settings:sound-devices-input",
+    "speaker": "ms-settings:sound-devices-output",
+    
+    # Network Settings
+    "network": "ms-settings:network",
+    "wifi": "ms-settings:network-wifi",
+    "ethernet": "ms-settings:network-ethernet",
+    "bluetooth": "ms-settings:bluetooth",
+    "airplane": "ms-settings:network-airplane",
+    "vpn": "ms-settings:network-vpn",
+    "proxy": "ms-settings:network-proxy",
+    "internet": "ms-settings:network",
+    
+    # Device Settings
+    "device": "ms-settings:devices",
+    "mouse": "ms-settings:devices-mouse",
+    "keyboard": "ms-settings:devices-keyboard",
+    "printer": "ms-settings:devices-printers-scanners",
+    "camera": "ms-settings:privacy-webcam",
+    "touchpad": "ms-settings:devices-touchpad",
+    
+    # System Settings
+    "system": "ms-settings:system",
+    "about": "ms-settings:system-about",
+    "storage": "ms-settings:system-storage",
+    "power": "ms-settings:powersleep",
+    "battery": "ms-settings:powersleep-battery",
+    "sleep": "ms-settings:powersleep",
+    
+    # Security & Privacy
+    "security": "ms-settings:privacy",
+    "privacy": "ms-settings:privacy",
+    "password": "ms-settings:accounts-passwordoptions",
+    "account": "ms-settings:accounts",
+    "accounts": "ms-settings:accounts",
+    "family": "ms-settings:family-group",
+    
+    # Apps & Features
+    "apps": "ms-settings:appsfeatures",
+    "programs": "ms-settings:appsfeatures",
+    "uninstall": "ms-settings:appsfeatures",
+    "startup": "ms-settings:startupapps",
+    
+    # Time & Date
+    "time": "ms-settings:dateandtime",
+    "date": "ms-settings:dateandtime",
+    "timezone": "ms-settings:dateandtime",
+    "clock": "ms-settings:dateandtime",
+    
+    # Language & Region
+    "language": "ms-settings:regionlanguage",
+    "region": "ms-settings:regionlanguage",
+    "keyboard layout": "ms-settings:regionlanguage",
+    
+    # Update & Security
+    "update": "ms-settings:windowsupdate",
+    "windows update": "ms-settings:windowsupdate",
+    "recovery": "ms-settings:recovery",
+    "backup": "ms-settings:backup",
+    "activation": "ms-settings:activation",
+})
+
+_CONTROL_PANEL_COMMANDS = types.MappingProxyType({
+    "all": "control",
+    "main": "control",
+    "admin": "control admintools",
+    "system": "control system",
+    "sound": "mmsys.cpl",
+    "display": "desk.cpl",
+    "network": "ncpa.cpl",
+    "devices": "devmgmt.msc",
+    "printer": "control printers",
+    "power": "powercfg.cpl",
+    "keyboard": "control keyboard",
+    "mouse": "control mouse",
+    "date": "timedate.cpl",
+    "language": "intl.cpl",
+    "fonts": "control fonts",
+    "programs": "appwiz.cpl",
+    "uninstall": "appwiz.cpl",
+})
+
 class SystemController:
     """Handle system-level operations and system control"""
     
-    # Global timer tracking
+    # Global timer tracking; all reads/writes go through _timers_lock -
+    # the GUI polls get_timer_status while the scheduler thread fires
     active_timers = {}
+    _timers_lock = threading.RLock()
+
+    # hex -> rendered BMP path, so repeat solid-color backgrounds skip
+    # the PIL encode and the ~6 MB temp-file write entirely
+    _solid_bg_cache = {}
+
+    # Long-lived PowerShell child shared by PowerShell-based commands -
+    # a fresh powershell.exe costs 300 ms+ of cold start per spawn
+    _ps_proc = None
+    _ps_lock = threading.Lock()
+
+    # Cached Core Audio endpoint-volume interface - re-enumerating the
+    # default speakers is several ms of COM round-trips per call
+    _endpoint_volume = None
+    _ev_lock = threading.Lock()
+
+    # One shared scheduler thread services every timer: it sleeps until
+    # the nearest deadline instead of one idle thread per timer
+    _scheduler = None
+    _scheduler_wakeup = None
+    _scheduler_lock = threading.Lock()
     
+    @staticmethod
+    def _get_scheduler() -> sched.scheduler:
+        """Get the shared scheduler, starting its worker thread lazily"""
+        with SystemController._scheduler_lock:
+            if SystemController._scheduler is None:
+                wakeup = threading.Event()
+
+                def delay(timeout):
+                    # Interruptible sleep: enqueuing an earlier deadline
+                    # sets the event so the worker re-checks the heap
+                    if wakeup.wait(timeout):
+                        wakeup.clear()
+
+                scheduler = sched.scheduler(time.monotonic, delay)
+
+                def run():
+                    while True:
+                        scheduler.run()
+                        wakeup.wait()
+                        wakeup.clear()
+
+                threading.Thread(target=run, daemon=True).start()
+                SystemController._scheduler = scheduler
+                SystemController._scheduler_wakeup = wakeup
+            return SystemController._scheduler
+
+    @staticmethod
+    def _schedule_at(when: float, action: Callable) -> sched.Event:
+        """Run action at monotonic time `when` on the shared scheduler"""
+        event = SystemController._get_scheduler().enterabs(when, 1, action)
+        SystemController._scheduler_wakeup.set()
+        return event
+
+    @staticmethod
+    def _cancel_timer_entry(timer: Dict[str, Any]) -> None:
+        """Cancel a timer's scheduled fire and mark it cancelled"""
+        timer["cancel_event"].set()
+        event = timer.get("sched_event")
+        if event is not None:
+            try:
+                SystemController._scheduler.cancel(event)
+            except ValueError:
+                pass  # already fired or removed
+
     @staticmethod
     def set_timer(minutes: int = 0, seconds: int = 0, timer_id: str = "default") -> Dict[str, Any]:
         """Set a countdown timer"""
@@ -28,59 +488,47 @@ class SystemController:
                 return {"status": "error", "message": "Timer must be greater than 0"}
             
             # Cancel existing timer with same ID
-            if timer_id in SystemController.active_timers:
-                cancel_thread = SystemController.active_timers[timer_id].get("thread")
-                if cancel_thread and cancel_thread.is_alive():
-                    SystemController.active_timers[timer_id]["cancelled"] = True
-            
+            with SystemController._timers_lock:
+                existing = SystemController.active_timers.get(timer_id)
+                if existing:
+                    SystemController._cancel_timer_entry(existing)
+
             timer_data = {
                 "total_seconds": total_seconds,
-                "remaining": total_seconds,
-                "cancelled": False,
-                "start_time": time.time(),
-                "paused": False,
-                "pause_time": None
+                "end_time": time.monotonic() + total_seconds,
+                "cancel_event": threading.Event(),
+                "start_time": time.time()
             }
-            
-            def countdown():
-                while timer_data["remaining"] > 0 and not timer_data["cancelled"]:
-                    time.sleep(1)
-                    
-                    if not timer_data["paused"]:
-                        timer_data["remaining"] -= 1
-                    
-                    # Print countdown (can be observed by GUI)
-                    if timer_data["remaining"] % 10 == 0 or timer_data["remaining"] <= 5:
-                        print(f"⏱️ Timer {timer_id}: {timer_data['remaining']} seconds remaining")
-                
-                if not timer_data["cancelled"]:
-                    # Timer finished - play sound
-                    try:
-                        winsound.Beep(1000, 500)  # 1000 Hz for 500 ms
-                        winsound.Beep(1000, 500)
-                        winsound.Beep(1000, 500)
-                    except:
-                        pass
-                    
-                    # Show notification
-                    try:
-                        subprocess.Popen(['powershell', '-Command', 
-                                        f'[Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, ContentType = WindowsRuntime] > $null; '
-                                        f'$APP_ID = "TimerApp"; '
-                                        f'[Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier($APP_ID).Show([Windows.UI.Notifications.ToastNotification]'
-                                        f'(New-Object Windows.Data.Xml.Dom.XmlDocument).LoadXml(@"<toast><visual><binding template=\\"ToastText02\\">'
-                                        f'<text id=\\"1\\">Timer Finished</text><text id=\\"2\\">Your {timer_id} timer is done!</text>'
-                                        f'</binding></visual></toast>@"))'],
-                                       capture_output=True, timeout=2)
-                    except:
-                        pass
-            
-            # Start timer in background thread
-            timer_thread = threading.Thread(target=countdown, daemon=True)
-            timer_thread.start()
-            timer_data["thread"] = timer_thread
-            
-            SystemController.active_timers[timer_id] = timer_data
+
+            def fire():
+                if timer_data["cancel_event"].is_set():
+                    return
+
+                # Timer finished - play sound without blocking the
+                # scheduler thread
+                try:
+                    winsound.PlaySound(
+                        _TIMER_BEEP_WAV, winsound.SND_MEMORY | winsound.SND_ASYNC)
+                except:
+                    pass
+
+                # Show notification
+                try:
+                    SystemController._show_toast(
+                        "Timer Finished", f"Your {timer_id} timer is done!")
+                except:
+                    pass
+
+                # Drop the finished entry so the dict doesn't grow unbounded
+                with SystemController._timers_lock:
+                    if SystemController.active_timers.get(timer_id) is timer_data:
+                        del SystemController.active_timers[timer_id]
+
+            timer_data["sched_event"] = SystemController._schedule_at(
+                timer_data["end_time"], fire)
+
+            with SystemController._timers_lock:
+                SystemController.active_timers[timer_id] = timer_data
             
             return {
                 "status": "success",
@@ -92,43 +540,151 @@ class SystemController:
         except Exception as e:
             return {"status": "error", "message": f"Error setting timer: {e}"}
     
+    @staticmethod
+    def _ps_exec(script: str, timeout: float = 5.0) -> str:
+        """Run a script on a shared persistent PowerShell process
+
+        The child is started once with -NoProfile -NonInteractive and kept
+        open; each call pipes the script to its stdin and reads output up
+        to a sentinel line, so repeated commands pay pipe I/O instead of
+        PowerShell startup. Restarts the child if it has exited, and kills
+        it if the sentinel does not arrive within timeout seconds.
+        """
+        with SystemController._ps_lock:
+            proc = SystemController._ps_proc
+            if proc is None or proc.poll() is not None:
+                proc = subprocess.Popen(
+                    ['powershell', '-NoProfile', '-NonInteractive', '-NoLogo',
+                     '-Command', '-'],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL, bufsize=1, text=True)
+                SystemController._ps_proc = proc
+
+            proc.stdin.write(script + "\nWrite-Output '===DONE==='\n")
+            proc.stdin.flush()
+
+            # A script that hits a terminating error aborts the rest of the
+            # piped input, so the sentinel never arrives; the watchdog kills
+            # the child after timeout (EOF ends the read) rather than
+            # blocking forever while holding _ps_lock
+            watchdog = threading.Timer(timeout, proc.kill)
+            watchdog.start()
+            got_sentinel = False
+            lines = []
+            try:
+                for line in proc.stdout:
+                    if line.strip() == '===DONE===':
+                        got_sentinel = True
+                        break
+                    lines.append(line)
+            finally:
+                watchdog.cancel()
+            if not got_sentinel:
+                # Timed out or crashed - reap the child and drop the handle
+                # so the next call spawns a fresh host
+                proc.kill()
+                proc.wait()
+                SystemController._ps_proc = None
+            return ''.join(lines)
+
+    @staticmethod
+    def _broadcast_setting_change(area: str = None) -> None:
+        """Tell running apps a setting changed (WM_SETTINGCHANGE broadcast)
+
+        Explorer re-reads the affected registry section when it sees the
+        broadcast; doing it in-process replaces a PowerShell round-trip.
+        The timeout flag keeps a hung window from blocking us.
+        """
+        SMTO_ABORTIFHUNG = 0x0002
+        _user32.SendMessageTimeoutW(
+            0xFFFF,  # HWND_BROADCAST
+            0x001A,  # WM_SETTINGCHANGE
+            0, ctypes.c_wchar_p(area),
+            SMTO_ABORTIFHUNG, 5000,
+            ctypes.byref(ctypes.c_ulong()))
+
+    @staticmethod
+    def _ps_run(script: str) -> None:
+        """Launch a one-shot PowerShell command, fire-and-forget
+
+        For callers where blocking would be worse than a lost result
+        (e.g. notifications fired from timer threads). Startup overhead
+        is trimmed via the shared _PS_ONESHOT flags and the script is
+        passed base64-encoded, immune to command-line escaping.
+        """
+        encoded = base64.b64encode(script.encode('utf-16le')).decode('ascii')
+        subprocess.Popen([*_PS_ONESHOT, encoded], **_POPEN_KW)
+
+    # Cached ToastNotifier - creating one is a COM round-trip per AUMID
+    _toast_notifier = None
+
+    @staticmethod
+    def _show_toast(title: str, message: str) -> None:
+        """Show a Windows toast notification"""
+        if ToastNotificationManager is not None:
+            doc = XmlDocument()
+            doc.load_xml(_TOAST_XML_TEMPLATE.format(title, message))
+            if SystemController._toast_notifier is None:
+                SystemController._toast_notifier = \
+                    ToastNotificationManager.create_toast_notifier("TimerApp")
+            SystemController._toast_notifier.show(ToastNotification(doc))
+            return
+
+        # Fallback: one-shot PowerShell toast (cold start ~100-300 ms)
+        SystemController._ps_run(_TOAST_PS_TEMPLATE.format(title, message))
+
     @staticmethod
     def cancel_timer(timer_id: str = "default") -> Dict[str, Any]:
         """Cancel a running timer"""
-        if timer_id in SystemController.active_timers:
-            SystemController.active_timers[timer_id]["cancelled"] = True
-            return {"status": "success", "message": f"Timer {timer_id} cancelled"}
+        with SystemController._timers_lock:
+            timer = SystemController.active_timers.pop(timer_id, None)
+            if timer is not None:
+                SystemController._cancel_timer_entry(timer)
+                return {"status": "success", "message": f"Timer {timer_id} cancelled"}
         return {"status": "error", "message": f"No timer found with ID {timer_id}"}
     
     @staticmethod
     def get_timer_status(timer_id: str = "default") -> Dict[str, Any]:
         """Get status of a timer"""
-        if timer_id in SystemController.active_timers:
-            timer = SystemController.active_timers[timer_id]
-            minutes = timer["remaining"] // 60
-            seconds = timer["remaining"] % 60
+        with SystemController._timers_lock:
+            timer = SystemController.active_timers.get(timer_id)
+        if timer is not None:
+            remaining = max(0, int(timer["end_time"] - time.monotonic() + 0.5))
+            minutes = remaining // 60
+            seconds = remaining % 60
             return {
                 "status": "success",
                 "timer_id": timer_id,
                 "remaining": f"{minutes:02d}:{seconds:02d}",
-                "remaining_seconds": timer["remaining"],
+                "remaining_seconds": remaining,
                 "total_seconds": timer["total_seconds"]
             }
         return {"status": "error", "message": f"No timer found with ID {timer_id}"}
     
     @staticmethod
-    def schedule_action(delay_seconds: int, action: Callable, *args, **kwargs) -> threading.Thread:
-        """Schedule an action to run after a delay (in seconds)"""
-        def delayed_action():
-            time.sleep(delay_seconds)
+    def schedule_action(delay_seconds: int, action: Callable, *args, **kwargs) -> sched.Event:
+        """Schedule an action to run after a delay (in seconds)
+
+        Runs on the shared scheduler thread instead of a dedicated one per
+        action; the returned event can be passed to cancel_scheduled.
+        """
+        def safe_call():
             try:
                 action(*args, **kwargs)
             except Exception as e:
                 print(f"Error executing scheduled action: {e}")
-        
-        thread = threading.Thread(target=delayed_action, daemon=True)
-        thread.start()
-        return thread
+
+        return SystemController._schedule_at(
+            time.monotonic() + delay_seconds, safe_call)
+
+    @staticmethod
+    def cancel_scheduled(event: sched.Event) -> bool:
+        """Cancel an action scheduled with schedule_action"""
+        try:
+            SystemController._scheduler.cancel(event)
+            return True
+        except (ValueError, AttributeError):
+            return False
     
     @staticmethod
     def change_background(image_path: str = None, color: str = None) -> bool:
@@ -142,26 +698,43 @@ class SystemController:
                 # Check if it's a valid file path
                 if os.path.exists(image_path_clean):
                     # It's a valid file - use it as wallpaper
-                    ctypes.windll.user32.SystemParametersInfoW(20, 0, image_path_clean, 3)
+                    _SystemParametersInfoW(20, 0, image_path_clean, 3)
                     return True
                 # If not a valid path, treat it as a color name
                 color = image_path
             
             if color:
-                # Convert color name to hex if it's a name
-                if color.startswith('#') or color.startswith('0x'):
-                    hex_color = color
+                if color.startswith(('#', '0x', '0X')):
+                    # Hex input is validated once, before any rendering
+                    normalized = _normalize_hex(color)
+                    if normalized is None:
+                        return False
                 else:
-                    # It's a color name - convert it
-                    hex_color = SystemController.convert_color_name_to_hex(color)
-                
-                # Create solid color image
-                img = Image.new('RGB', (1920, 1080), hex_color)
-                temp_path = os.path.join(tempfile.gettempdir(), 'bg_temp.bmp')
-                img.save(temp_path)
-                
+                    # It's a color name - the table only holds valid hex
+                    normalized = _normalize_hex(
+                        SystemController.convert_color_name_to_hex(color))
+                hex_color, (r, g, b) = normalized
+
+                # Solid colors take the pure Win32 path: blank the wallpaper
+                # and set the desktop color directly - no PIL render, no
+                # temp-file write
+                colorref = (b << 16) | (g << 8) | r
+                _SystemParametersInfoW(20, 0, "", 3)
+                if _SetSysColors(1, (ctypes.c_int * 1)(1),
+                                 (ctypes.c_uint * 1)(colorref)):
+                    return True
+
+                # Fallback: render the solid color once per hex and reuse the file
+                temp_path = SystemController._solid_bg_cache.get(hex_color)
+                if temp_path is None or not os.path.exists(temp_path):
+                    img = Image.new('RGB', (1920, 1080), hex_color)
+                    temp_path = os.path.join(
+                        tempfile.gettempdir(), f"bg_{hex_color.lstrip('#')}.bmp")
+                    img.save(temp_path)
+                    SystemController._solid_bg_cache[hex_color] = temp_path
+
                 # Windows API to set wallpaper
-                ctypes.windll.user32.SystemParametersInfoW(20, 0, temp_path, 3)
+                _SystemParametersInfoW(20, 0, temp_path, 3)
                 return True
             
             return False
@@ -172,59 +745,62 @@ class SystemController:
     @staticmethod
     def get_color_codes() -> Dict[str, str]:
         """Get common color hex codes"""
-        return {
-            "white": "#FFFFFF",
-            "black": "#000000",
-            "blue": "#0000FF",
-            "red": "#FF0000",
-            "green": "#00FF00",
-            "yellow": "#FFFF00",
-            "orange": "#FFA500",
-            "purple": "#800080",
-            "pink": "#FFC0CB",
-            "dark": "#1a1a1a",
-            "light": "#F5F5F5",
-            "gray": "#808080",
-            "cyan": "#00FFFF",
-            "magenta": "#FF00FF",
-        }
-    
+        return _COLOR_HEX
+
     @staticmethod
     def convert_color_name_to_hex(color_name: str) -> str:
         """Convert color names to hex codes"""
-        colors = SystemController.get_color_codes()
         color_lower = color_name.lower().strip()
-        
-        # Check for exact matches
-        if color_lower in colors:
-            return colors[color_lower]
-        
-        # Check for partial matches
-        for name, hex_code in colors.items():
-            if color_lower in name or name in color_lower:
-                return hex_code
-        
-        return "#000000"  # Default to black
+        key = _COLOR_ALIASES.get(color_lower, color_lower)
+        return _COLOR_HEX.get(key, "#000000")  # Default to black
     
+    # Cached brightness setter callable - connecting to the WMI namespace
+    # costs hundreds of ms and only needs to happen once
+    _set_brightness_impl = None
+
+    @staticmethod
+    def _get_brightness_impl():
+        """Build (once) a callable that sets monitor brightness via WMI"""
+        if SystemController._set_brightness_impl is None:
+            try:
+                import win32com.client
+                methods = win32com.client.GetObject(
+                    r"winmgmts:\\.\root\wmi").InstancesOf(
+                    "WmiMonitorBrightnessMethods")[0]
+                SystemController._set_brightness_impl = \
+                    lambda lvl, m=methods: m.WmiSetBrightness(0, lvl)
+            except ImportError:
+                import wmi
+                monitors = wmi.WMI(namespace='wmi').WmiMonitorBrightnessMethods()
+                if monitors:
+                    SystemController._set_brightness_impl = \
+                        lambda lvl, m=monitors[0]: m.WmiSetBrightness(
+                            Brightness=lvl, Timeout=0)
+        return SystemController._set_brightness_impl
+
     @staticmethod
     def set_brightness(level: int) -> bool:
         """Set screen brightness (0-100%)"""
         try:
             level = max(0, min(100, level))
-            
+
             # Try using WMI first
             try:
-                import wmi
-                c = wmi.WMI(namespace='wmiclass')
-                monitors = c.WmiMonitorBrightnessMethods()
-                
-                if monitors:
-                    method = monitors[0]
-                    method.WmiSetBrightness(Brightness=level, Timeout=0)
+                set_level = SystemController._get_brightness_impl()
+                if set_level is not None:
+                    try:
+                        set_level(level)
+                    except Exception:
+                        # Stale COM object (e.g. monitor change) - rebuild once
+                        SystemController._set_brightness_impl = None
+                        set_level = SystemController._get_brightness_impl()
+                        if set_level is None:
+                            raise
+                        set_level(level)
                     return True
             except:
                 pass
-            
+
             # Alternative: use nircmd if available
             try:
                 subprocess.run(['nircmd', 'monitor', 'setbrightness', str(level)], 
@@ -238,6 +814,19 @@ class SystemController:
         
         return False
     
+    @staticmethod
+    def _get_endpoint_volume():
+        """Get the default speakers' endpoint-volume interface, cached
+
+        The interface stays valid until the default audio device changes;
+        callers reset the cache and retry on COM errors.
+        """
+        with SystemController._ev_lock:
+            if SystemController._endpoint_volume is None:
+                from pycaw.pycaw import AudioUtilities
+                SystemController._endpoint_volume = AudioUtilities.GetSpeakers().EndpointVolume
+            return SystemController._endpoint_volume
+
     @staticmethod
     def set_volume(level: int = None, level_text: str = None) -> Dict[str, Any]:
         """
@@ -253,15 +842,7 @@ class SystemController:
         try:
             # Parse level from text if provided
             if level_text:
-                text_lower = level_text.lower().strip()
-                level_map = {
-                    'off': 0, 'mute': 0, 'silent': 0,
-                    'low': 25, 'quiet': 25, 'soft': 25,
-                    'mid': 50, 'middle': 50, 'medium': 50, 'normal': 50,
-                    'high': 75, 'loud': 75, 'volume': 75, 'up': 75,
-                    'max': 100, 'maximum': 100, 'full': 100, 'highest': 100, 'loudest': 100
-                }
-                level = level_map.get(text_lower, None)
+                level = _VOLUME_LEVEL_MAP.get(level_text.lower().strip())
             
             if level is None:
                 level = 50
@@ -274,21 +855,16 @@ class SystemController:
             
             # Method 1: pycaw (Most reliable - works directly with Windows Core Audio)
             try:
-                from pycaw.pycaw import AudioUtilities
-                import time
-                
-                # Get the default speakers
-                devices = AudioUtilities.GetSpeakers()
-                
-                # Get the EndpointVolume interface directly (NOT via Activate)
-                volume = devices.EndpointVolume
-                
-                # Set the volume
-                volume.SetMasterVolumeLevelScalar(volume_scalar, None)
-                
-                # Small delay to ensure change takes effect
-                time.sleep(0.1)
-                
+                volume = SystemController._get_endpoint_volume()
+                try:
+                    volume.SetMasterVolumeLevelScalar(volume_scalar, None)
+                except Exception:
+                    # Stale interface after a device change - rebuild once
+                    with SystemController._ev_lock:
+                        SystemController._endpoint_volume = None
+                    volume = SystemController._get_endpoint_volume()
+                    volume.SetMasterVolumeLevelScalar(volume_scalar, None)
+
                 return {
                     "status": "success",
                     "message": f"Volume set to {level}%",
@@ -342,8 +918,18 @@ class SystemController:
             # Mute commands
             if action_lower in ["mute", "off", "silent"]:
                 try:
-                    # First try nircmd
-                    result = subprocess.run(['nircmd', 'mutesysvolume', '1'], 
+                    # Cached Core Audio endpoint: one COM call, no subprocess
+                    SystemController._get_endpoint_volume().SetMute(1, None)
+                    return {
+                        "status": "success",
+                        "message": "Volume muted",
+                        "action": "mute"
+                    }
+                except Exception:
+                    pass
+
+                try:
+                    result = subprocess.run(['nircmd', 'mutesysvolume', '1'],
                                           capture_output=True, timeout=3)
                     if result.returncode == 0:
                         return {
@@ -360,7 +946,17 @@ class SystemController:
             # Unmute commands
             elif action_lower in ["unmute", "on", "unmute"]:
                 try:
-                    result = subprocess.run(['nircmd', 'mutesysvolume', '0'], 
+                    SystemController._get_endpoint_volume().SetMute(0, None)
+                    return {
+                        "status": "success",
+                        "message": "Volume unmuted",
+                        "action": "unmute"
+                    }
+                except Exception:
+                    pass
+
+                try:
+                    result = subprocess.run(['nircmd', 'mutesysvolume', '0'],
                                           capture_output=True, timeout=3)
                     if result.returncode == 0:
                         return {
@@ -417,88 +1013,33 @@ class SystemController:
     def open_application(app_name: str) -> bool:
         """Open a system application by name"""
         try:
-            apps = {
-                # Microsoft Built-in Apps
-                "notepad": "notepad.exe",
-                "notepad++": "notepad++",
-                "calculator": "calc.exe",
-                "calc": "calc.exe",
-                "paint": "mspaint.exe",
-                "mspaint": "mspaint.exe",
-                "explorer": "explorer.exe",
-                "file explorer": "explorer.exe",
-                "file": "explorer.exe",
-                "files": "explorer.exe",
-                "powershell": "powershell.exe",
-                "powershell ise": "powershell_ise.exe",
-                "cmd": "cmd.exe",
-                "command prompt": "cmd.exe",
-                "terminal": "cmd.exe",
-                "settings": "ms-settings:",
-                "control panel": "control.exe",
-                "device manager": "devmgmt.msc",
-                "task manager": "taskmgr.exe",
-                "disk management": "diskmgmt.msc",
-                
-                # Development Tools
-                "jupyter": "jupyter notebook",
-                "notebook": "jupyter notebook",
-                "jupyter notebook": "jupyter notebook",
-                "jupyter lab": "jupyter lab",
-                "lab": "jupyter lab",
-                "vscode": "code",
-                "vs code": "code",
-                "visual studio": "devenv.exe",
-                "python": "python",
-                
-                # Office Applications
-                "word": "winword.exe",
-                "excel": "excel.exe",
-                "powerpoint": "powerpnt.exe",
-                "outlook": "outlook.exe",
-                "access": "msaccess.exe",
-                "publisher": "mspub.exe",
-                
-                # Browsers
-                "chrome": "chrome.exe",
-                "google chrome": "chrome.exe",
-                "firefox": "firefox.exe",
-                "mozilla firefox": "firefox.exe",
-                "edge": "msedge.exe",
-                "internet explorer": "iexplore.exe",
-                "ie": "iexplore.exe",
-                "opera": "opera.exe",
-                
-                # Media & Entertainment
-                "vlc": "vlc.exe",
-                "media player": "wmplayer.exe",
-                "groove": "groove.exe",
-                "movies": "WinMoviesApp.exe",
-                "photos": "PhotosApp.exe",
-                
-                # Utilities
-                "snipping tool": "SnippingTool.exe",
-                "screenshot": "SnippingTool.exe",
-                "clipboard": "clipbrd.exe",
-                "character map": "charmap.exe",
-                "system information": "msinfo32.exe",
-                "resource monitor": "resmon.exe",
-                "performance monitor": "perfmon.exe",
-                "registry editor": "regedit.exe",
-                "regedit": "regedit.exe",
-                "disk cleanup": "cleanmgr.exe",
-                "winrar": "WinRAR.exe",
-                "7zip": "7zFM.exe",
-            }
-            
             app_lower = app_name.lower().strip()
 
+            # Known apps dispatch straight to their launch strategy; the
+            # generic ladder below only runs for unknown names or if the
+            # direct launch fails
+            entry = _APPS_TYPED.get(app_lower)
+            if entry is not None:
+                kind, target = entry
+                try:
+                    if kind == "uri":
+                        os.startfile(target)
+                    elif kind == "pymod":
+                        subprocess.Popen([sys.executable, '-m', target])
+                    elif kind == "exe":
+                        subprocess.Popen([target])
+                    else:  # needs cmd.exe resolution
+                        subprocess.Popen(['cmd', '/c', target],
+                                         **_POPEN_KW)
+                    return True
+                except Exception:
+                    pass
+
             # Get the app command, or use the original if not found
-            app_command = apps.get(app_lower, app_name)
+            app_command = _APPS.get(app_lower, app_name)
 
             # Special handling for Jupyter / notebook / lab to provide multiple fallbacks
-            notebook_keys = {"jupyter", "notebook", "jupyter notebook", "jupyter lab", "lab"}
-            if app_lower in notebook_keys or "jupyter" in app_command.lower():
+            if app_lower in _NOTEBOOK_KEYS or "jupyter" in app_command.lower():
                 # 1) Try launching using the current Python interpreter (most reliable)
                 try:
                     subprocess.Popen([sys.executable, '-m', 'notebook'])
@@ -521,7 +1062,8 @@ class SystemController:
                         exe = cmd.split()[0]
                         # If the executable exists on PATH or the command is 'py', attempt it
                         if shutil.which(exe) or exe.lower() in ("py", "python"):
-                            subprocess.Popen(cmd, shell=True)
+                            subprocess.Popen(['cmd', '/c', cmd],
+                                             **_POPEN_KW)
                             return True
                     except Exception:
                         continue
@@ -534,30 +1076,31 @@ class SystemController:
             except FileNotFoundError:
                 pass
             except Exception:
-                # Some commands require shell=True (e.g., contain spaces or -m)
+                # Some commands need cmd.exe resolution (spaces, .cmd shims)
                 try:
-                    subprocess.Popen(app_command, shell=True)
+                    subprocess.Popen(['cmd', '/c', app_command],
+                                     **_POPEN_KW)
                     return True
                 except Exception:
                     pass
 
             # Try with START (Windows) and where lookup
             try:
-                subprocess.Popen(f"start {app_command}", shell=True)
+                subprocess.Popen(['cmd', '/c', 'start', '', app_command],
+                                 **_POPEN_KW)
                 return True
             except Exception:
-                try:
-                    result = subprocess.run(['where', app_lower], capture_output=True, text=True)
-                    if result.stdout:
-                        exe_path = result.stdout.strip().split('\n')[0]
+                exe_path = _resolve_exe(app_lower)
+                if exe_path:
+                    try:
                         subprocess.Popen(exe_path)
                         return True
-                except Exception:
-                    pass
+                    except Exception:
+                        pass
 
-            # If all methods fail, try launching with quotes as a last attempt
+            # Last attempt: a single-element list quotes paths with spaces
             try:
-                subprocess.Popen(f'"{app_command}"', shell=True)
+                subprocess.Popen([app_command])
                 return True
             except Exception:
                 pass
@@ -571,97 +1114,16 @@ class SystemController:
     def open_system_settings(setting_type: str = "general") -> bool:
         """Open Windows Settings for various configurations"""
         try:
-            settings_commands = {
-                # General Settings
-                "settings": "ms-settings:",
-                "general": "ms-settings:",
-                
-                # Display & Visual Settings
-                "display": "ms-settings:display",
-                "screen": "ms-settings:display",
-                "resolution": "ms-settings:display-advanced",
-                "wallpaper": "ms-settings:personalization-background",
-                "background": "ms-settings:personalization-background",
-                "desktop": "ms-settings:personalization-background",
-                "theme": "ms-settings:themes",
-                "dark mode": "ms-settings:themes",
-                "light mode": "ms-settings:themes",
-                "personalization": "ms-settings:personalization",
-                "colors": "ms-settings:personalization-colors",
-                "start": "ms-settings:personalization-start",
-                "taskbar": "ms-settings:personalization-taskbar",
-                "lock screen": "ms-settings:lockscreen",
-                
-                # Sound Settings
-                "sound": "ms-settings:sound",
-                "volume": "ms-settings:sound",
-                "audio": "ms-settings:sound",
-                "microphone": "ms-settings:sound-devices-input",
-                "speaker": "ms-settings:sound-devices-output",
-                
-                # Network Settings
-                "network": "ms-settings:network",
-                "wifi": "ms-settings:network-wifi",
-                "ethernet": "ms-settings:network-ethernet",
-                "bluetooth": "ms-settings:bluetooth",
-                "airplane": "ms-settings:network-airplane",
-                "vpn": "ms-settings:network-vpn",
-                "proxy": "ms-settings:network-proxy",
-                "internet": "ms-settings:network",
-                
-                # Device Settings
-                "device": "ms-settings:devices",
-                "mouse": "ms-settings:devices-mouse",
-                "keyboard": "ms-settings:devices-keyboard",
-                "printer": "ms-settings:devices-printers-scanners",
-                "camera": "ms-settings:privacy-webcam",
-                "touchpad": "ms-settings:devices-touchpad",
-                
-                # System Settings
-                "system": "ms-settings:system",
-                "about": "ms-settings:system-about",
-                "storage": "ms-settings:system-storage",
-                "power": "ms-settings:powersleep",
-                "battery": "ms-settings:powersleep-battery",
-                "sleep": "ms-settings:powersleep",
-                
-                # Security & Privacy
-                "security": "ms-settings:privacy",
-                "privacy": "ms-settings:privacy",
-                "password": "ms-settings:accounts-passwordoptions",
-                "account": "ms-settings:accounts",
-                "accounts": "ms-settings:accounts",
-                "family": "ms-settings:family-group",
-                
-                # Apps & Features
-                "apps": "ms-settings:appsfeatures",
-                "programs": "ms-settings:appsfeatures",
-                "uninstall": "ms-settings:appsfeatures",
-                "startup": "ms-settings:startupapps",
-                
-                # Time & Date
-                "time": "ms-settings:dateandtime",
-                "date": "ms-settings:dateandtime",
-                "timezone": "ms-settings:dateandtime",
-                "clock": "ms-settings:dateandtime",
-                
-                # Language & Region
-                "language": "ms-settings:regionlanguage",
-                "region": "ms-settings:regionlanguage",
-                "keyboard layout": "ms-settings:regionlanguage",
-                
-                # Update & Security
-                "update": "ms-settings:windowsupdate",
-                "windows update": "ms-settings:windowsupdate",
-                "recovery": "ms-settings:recovery",
-                "backup": "ms-settings:backup",
-                "activation": "ms-settings:activation",
-            }
-            
             setting_lower = setting_type.lower().strip()
-            command = settings_commands.get(setting_lower, "ms-settings:")
-            
-            subprocess.Popen(f"start {command}", shell=True)
+            command = _SETTINGS_COMMANDS.get(setting_lower, "ms-settings:")
+
+            # ShellExecuteW in-process - no cmd.exe "start" round-trip;
+            # ms-settings: URIs dispatch via the shell URI handler
+            try:
+                os.startfile(command)
+            except OSError:
+                subprocess.Popen(['cmd', '/c', 'start', '', command],
+                                 **_POPEN_KW)
             return True
         except Exception as e:
             print(f"Error opening settings: {e}")
@@ -671,30 +1133,19 @@ class SystemController:
     def open_control_panel(panel_type: str = "all") -> bool:
         """Open Windows Control Panel for legacy settings"""
         try:
-            control_panel_commands = {
-                "all": "control",
-                "main": "control",
-                "admin": "control admintools",
-                "system": "control system",
-                "sound": "mmsys.cpl",
-                "display": "desk.cpl",
-                "network": "ncpa.cpl",
-                "devices": "devmgmt.msc",
-                "printer": "control printers",
-                "power": "powercfg.cpl",
-                "keyboard": "control keyboard",
-                "mouse": "control mouse",
-                "date": "timedate.cpl",
-                "language": "intl.cpl",
-                "fonts": "control fonts",
-                "programs": "appwiz.cpl",
-                "uninstall": "appwiz.cpl",
-            }
-            
             panel_lower = panel_type.lower().strip()
-            command = control_panel_commands.get(panel_lower, "control")
-            
-            subprocess.Popen(command, shell=True)
+            command = _CONTROL_PANEL_COMMANDS.get(panel_lower, "control")
+
+            # Single-token entries (.cpl/.msc/control) launch in-process;
+            # "control <applet>" style commands still need a shell
+            if " " in command:
+                subprocess.Popen(command.split(), **_POPEN_KW)
+            else:
+                try:
+                    os.startfile(command)
+                except OSError:
+                    subprocess.Popen(['cmd', '/c', 'start', '', command],
+                                     **_POPEN_KW)
             return True
         except Exception as e:
             print(f"Error opening control panel: {e}")
@@ -704,7 +1155,7 @@ class SystemController:
     def open_device_manager() -> bool:
         """Open Device Manager to manage hardware devices"""
         try:
-            subprocess.Popen("devmgmt.msc", shell=True)
+            os.startfile("devmgmt.msc")
             return True
         except Exception as e:
             print(f"Error opening device manager: {e}")
@@ -740,34 +1191,71 @@ class SystemController:
                 Stop-Service -Name "bthserv" -Force -ErrorAction SilentlyContinue
                 """
             
-            subprocess.run(['powershell', '-Command', ps_command], 
-                         capture_output=True, timeout=5)
+            SystemController._ps_exec(ps_command)
             return True
         except Exception as e:
             print(f"Error toggling Bluetooth: {e}")
             # Fallback: try WMI
             try:
-                subprocess.run(['powershell', '-Command', 
-                              'Enable-NetAdapter -Name "Bluetooth*" -Confirm:$false'],
-                             capture_output=True, timeout=5)
+                SystemController._ps_exec(
+                    'Enable-NetAdapter -Name "Bluetooth*" -Confirm:$false')
                 return True
             except:
                 return False
     
     @staticmethod
-    def toggle_wifi(enable: bool = None) -> bool:
-        """Turn Wi-Fi on or off directly"""
+    def _toggle_wifi_wmi(enable: bool = None) -> bool:
+        """Flip the Wi-Fi adapter admin state via the cached WMI connection
+
+        In-process Enable()/Disable() on Win32_NetworkAdapter avoids the
+        netsh spawn and its interface enumeration, and does not depend on
+        the adapter being literally named "Wi-Fi" on localized systems.
+        Returns False if no wireless adapter was found.
+        """
+        svc = SystemController._get_wmi_service()
+        adapters = list(svc.ExecQuery(
+            "SELECT * FROM Win32_NetworkAdapter "
+            "WHERE PhysicalAdapter=TRUE AND "
+            "(NetConnectionID LIKE '%Wi-Fi%' OR Name LIKE '%Wireless%')"))
+        if not adapters:
+            return False
+        for adapter in adapters:
+            target = (not adapter.NetEnabled) if enable is None else enable
+            if target:
+                adapter.Enable()
+            else:
+                adapter.Disable()
+        return True
+
+    @staticmethod
+    def toggle_wifi(enable: bool = None, await_completion: bool = False) -> bool:
+        """Turn Wi-Fi on or off directly
+
+        By default the netsh command is dispatched fire-and-forget, so the
+        caller pays only the process spawn (~10-30 ms) instead of waiting
+        up to 5 s for it to finish. Pass await_completion=True to block
+        until netsh has actually applied the change.
+        """
+        try:
+            if SystemController._toggle_wifi_wmi(enable):
+                return True
+        except Exception:
+            # Stale or unavailable COM connection - drop the cached handle
+            # and fall through to netsh
+            SystemController._wmi_service = None
         try:
             if enable is None:
-                # Toggle
-                subprocess.run(['netsh', 'interface', 'set', 'interface', 'name=Wi-Fi', 'admin=toggle'],
-                             shell=True, capture_output=True, timeout=5)
+                admin = 'admin=toggle'
             elif enable:
-                subprocess.run(['netsh', 'interface', 'set', 'interface', 'name=Wi-Fi', 'admin=enabled'],
-                             shell=True, capture_output=True, timeout=5)
+                admin = 'admin=enabled'
+            else:
+                admin = 'admin=disabled'
+            args = ['netsh', 'interface', 'set', 'interface', 'name=Wi-Fi', admin]
+            if await_completion:
+                subprocess.run(args, capture_output=True, timeout=5,
+                             creationflags=subprocess.CREATE_NO_WINDOW)
             else:
-                subprocess.run(['netsh', 'interface', 'set', 'interface', 'name=Wi-Fi', 'admin=disabled'],
-                             shell=True, capture_output=True, timeout=5)
+                subprocess.Popen(args, **_POPEN_KW)
             return True
         except Exception as e:
             print(f"Error toggling Wi-Fi: {e}")
@@ -784,13 +1272,13 @@ class SystemController:
             
             if enable is None:
                 # Toggle - use Settings app shortcut
-                subprocess.Popen("ms-settings:network-airplane", shell=True)
+                os.startfile("ms-settings:network-airplane")
             elif enable:
                 # Enable Airplane Mode via Settings
-                subprocess.Popen("ms-settings:network-airplane", shell=True)
+                os.startfile("ms-settings:network-airplane")
             else:
                 # Disable Airplane Mode
-                subprocess.Popen("ms-settings:network-airplane", shell=True)
+                os.startfile("ms-settings:network-airplane")
             
             return True
         except Exception as e:
@@ -801,16 +1289,15 @@ class SystemController:
     def toggle_screen_saver(enable: bool = None) -> bool:
         """Turn screen saver on or off"""
         try:
-            if enable is None or enable:
-                # Enable screen saver
-                subprocess.run(['powershell', '-Command',
-                              'Set-ItemProperty -Path "HKCU:\\Control Panel\\Desktop" -Name "ScreenSaveActive" -Value 1'],
-                             capture_output=True, timeout=5)
-            else:
-                # Disable screen saver
-                subprocess.run(['powershell', '-Command',
-                              'Set-ItemProperty -Path "HKCU:\\Control Panel\\Desktop" -Name "ScreenSaveActive" -Value 0'],
-                             capture_output=True, timeout=5)
+            value = "1" if (enable is None or enable) else "0"
+            # Direct registry write - same value the PowerShell one-liner
+            # set, minus the round-trip through the host
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER,
+                                r'Control Panel\Desktop', 0,
+                                winreg.KEY_SET_VALUE) as key:
+                winreg.SetValueEx(key, 'ScreenSaveActive', 0,
+                                  winreg.REG_SZ, value)
+            SystemController._broadcast_setting_change('Control Panel\\Desktop')
             return True
         except Exception as e:
             print(f"Error toggling screen saver: {e}")
@@ -820,16 +1307,15 @@ class SystemController:
     def toggle_do_not_disturb(enable: bool = None) -> bool:
         """Turn Do Not Disturb mode on or off"""
         try:
-            if enable is None or enable:
-                # Enable Do Not Disturb
-                subprocess.run(['powershell', '-Command',
-                              'Set-ItemProperty -Path "HKCU:\\Software\\Microsoft\\Windows\\CurrentVersion\\Notifications\\Settings" -Name "NOC_GLOBAL_SETTING_ALLOW_NOTIFICATION_SOUND" -Value 0'],
-                             capture_output=True, timeout=5)
-            else:
-                # Disable Do Not Disturb
-                subprocess.run(['powershell', '-Command',
-                              'Set-ItemProperty -Path "HKCU:\\Software\\Microsoft\\Windows\\CurrentVersion\\Notifications\\Settings" -Name "NOC_GLOBAL_SETTING_ALLOW_NOTIFICATION_SOUND" -Value 1'],
-                             capture_output=True, timeout=5)
+            # Sound setting is inverted: 0 silences notifications (DND on)
+            value = 0 if (enable is None or enable) else 1
+            with winreg.OpenKey(
+                    winreg.HKEY_CURRENT_USER,
+                    r'Software\Microsoft\Windows\CurrentVersion\Notifications\Settings',
+                    0, winreg.KEY_SET_VALUE) as key:
+                winreg.SetValueEx(key, 'NOC_GLOBAL_SETTING_ALLOW_NOTIFICATION_SOUND',
+                                  0, winreg.REG_DWORD, value)
+            SystemController._broadcast_setting_change()
             return True
         except Exception as e:
             print(f"Error toggling Do Not Disturb: {e}")
@@ -839,9 +1325,9 @@ class SystemController:
     def lock_screen() -> bool:
         """Lock the Windows screen"""
         try:
-            subprocess.run(['rundll32.exe', 'user32.dll,LockWorkStation'], 
-                         capture_output=True, timeout=5)
-            return True
+            # Direct Win32 call - same API rundll32 would invoke, minus the
+            # process spawn
+            return bool(_user32.LockWorkStation())
         except Exception as e:
             print(f"Error locking screen: {e}")
             return False
@@ -851,8 +1337,9 @@ class SystemController:
         """Put system to sleep"""
         try:
             if minutes <= 0:
-                subprocess.run(['rundll32.exe', 'powrprof.dll,SetSuspendState', '0', '1', '0'],
-                             capture_output=True, timeout=5)
+                # In-process suspend; the rundll32 form of SetSuspendState is
+                # documented to misinterpret its arguments anyway
+                ctypes.windll.powrprof.SetSuspendState(False, True, False)
             else:
                 subprocess.run(['powercfg', '/change', 'monitor-timeout-ac', str(minutes)],
                              capture_output=True, timeout=5)
@@ -862,38 +1349,30 @@ class SystemController:
             return False
     
     @staticmethod
-    def shutdown_system(minutes: int = 0) -> bool:
-        """Shutdown the system"""
+    def _initiate_shutdown(flag: str, minutes: int, action: str) -> bool:
+        """Shared shutdown.exe dispatch for shutdown_system/restart_system"""
         try:
-            if minutes <= 0:
-                subprocess.run(['shutdown', '/s', '/t', '0'],
-                             capture_output=True, timeout=5)
-            else:
-                subprocess.run(['shutdown', '/s', '/t', str(minutes * 60)],
-                             capture_output=True, timeout=5)
+            delay = str(minutes * 60) if minutes > 0 else '0'
+            subprocess.run(['shutdown', flag, '/t', delay],
+                         capture_output=True, timeout=5)
             return True
         except Exception as e:
-            print(f"Error shutting down system: {e}")
+            print(f"Error {action} system: {e}")
             return False
     
+    @staticmethod
+    def shutdown_system(minutes: int = 0) -> bool:
+        """Shutdown the system"""
+        return SystemController._initiate_shutdown('/s', minutes, 'shutting down')
+    
     @staticmethod
     def restart_system(minutes: int = 0) -> bool:
         """Restart the system"""
-        try:
-            if minutes <= 0:
-                subprocess.run(['shutdown', '/r', '/t', '0'],
-                             capture_output=True, timeout=5)
-            else:
-                subprocess.run(['shutdown', '/r', '/t', str(minutes * 60)],
-                             capture_output=True, timeout=5)
-            return True
-        except Exception as e:
-            print(f"Error restarting system: {e}")
-            return False
+        return SystemController._initiate_shutdown('/r', minutes, 'restarting')
     def open_task_manager() -> bool:
         """Open Windows Task Manager"""
         try:
-            subprocess.Popen("taskmgr")
+            subprocess.Popen(["taskmgr"], **_POPEN_KW)
             return True
         except Exception as e:
             print(f"Error opening task manager: {e}")
@@ -903,37 +1382,161 @@ class SystemController:
     def open_system_preferences(preference: str) -> bool:
         """Generic system preference opener"""
         try:
-            # First try Windows Settings
-            if SystemController.open_system_settings(preference):
-                return True
-            # Fallback to Control Panel
-            return SystemController.open_control_panel(preference)
-        except Exception as e:
-            print(f"Error opening preferences: {e}")
-            return False
-        try:
-            if enable is None:
-                # Toggle
-                subprocess.run(['netsh', 'interface', 'set', 'interface', 'name=Wi-Fi', 'admin=toggle'],
-                             shell=True, capture_output=True)
-            elif enable:
-                subprocess.run(['netsh', 'interface', 'set', 'interface', 'name=Wi-Fi', 'admin=enabled'],
-                             shell=True, capture_output=True)
-            else:
-                subprocess.run(['netsh', 'interface', 'set', 'interface', 'name=Wi-Fi', 'admin=disabled'],
-                             shell=True, capture_output=True)
+            pref_lower = preference.lower().strip()
+            # Direct table lookups: a Settings URI if one matches, then a
+            # Control Panel applet, then the Settings home page. The old
+            # delegation never reached Control Panel because
+            # open_system_settings defaults unknown names to ms-settings:
+            command = _SETTINGS_COMMANDS.get(pref_lower)
+            if command is None and pref_lower in _CONTROL_PANEL_COMMANDS:
+                return SystemController.open_control_panel(pref_lower)
+            if command is None:
+                command = "ms-settings:"
+            try:
+                os.startfile(command)
+            except OSError:
+                subprocess.Popen(['cmd', '/c', 'start', '', command],
+                                 **_POPEN_KW)
             return True
         except Exception as e:
-            print(f"Error toggling Wi-Fi: {e}")
+            print(f"Error opening preferences: {e}")
             return False
     
+    # Shared WMI COM connection for system info queries (lazy, cached) -
+    # connecting to the namespace costs far more than the queries themselves
+    _wmi_service = None
+
+    @staticmethod
+    def _get_wmi_service():
+        """Return the cached root\\cimv2 WMI connection, creating it on first use"""
+        if SystemController._wmi_service is None:
+            import win32com.client
+            SystemController._wmi_service = win32com.client.GetObject(
+                r"winmgmts:\\.\root\cimv2")
+        return SystemController._wmi_service
+
+    @staticmethod
+    def _collect_windows_info_wmi(info: Dict[str, Any]) -> None:
+        """Fill Windows fields via in-process WMI queries
+
+        Replaces the systeminfo/wmic child processes, which each cost
+        hundreds of ms of spawn plus text parsing, with a few COM calls
+        on the shared connection.
+        """
+        svc = SystemController._get_wmi_service()
+
+        os_rec = list(svc.InstancesOf("Win32_OperatingSystem"))[0]
+        info["OS_Name"] = (os_rec.Caption or "").strip()
+        info["OS_Version"] = f"{os_rec.Version} Build {os_rec.BuildNumber}"
+        info["Boot_Time"] = os_rec.LastBootUpTime
+        try:
+            total_phys, avail_phys = _memory_status()
+        except OSError:
+            total_phys = int(os_rec.TotalVisibleMemorySize) * 1024
+            avail_phys = int(os_rec.FreePhysicalMemory) * 1024
+        info["Total_RAM"] = f"{total_phys // (1024 * 1024):,} MB"
+        info["Available_RAM"] = f"{avail_phys // (1024 * 1024):,} MB"
+
+        cs = list(svc.InstancesOf("Win32_ComputerSystem"))[0]
+        info["System_Type"] = cs.SystemType
+
+        cpus = list(svc.InstancesOf("Win32_Processor"))
+        info["Processor_Count"] = str(len(cpus))
+        if cpus:
+            info["CPU_Name"] = (cpus[0].Name or "").strip()
+            info["CPU_Cores"] = str(sum(c.NumberOfCores for c in cpus))
+            info["CPU_Threads"] = str(sum(c.NumberOfLogicalProcessors for c in cpus))
+
+        gpu_list = []
+        for gpu in svc.InstancesOf("Win32_VideoController"):
+            gpu_name = (gpu.Name or "").strip()
+            if not gpu_name:
+                continue
+            try:
+                vram = int(gpu.AdapterRAM) / (1024**3)
+                gpu_list.append(f"{gpu_name} ({vram:.2f} GB)")
+            except (TypeError, ValueError):
+                gpu_list.append(gpu_name)
+        if gpu_list:
+            info["GPU"] = "; ".join(gpu_list)
+        else:
+            info["GPU"] = "Detection in progress... Check Device Manager for graphics cards"
+
+    @staticmethod
+    def _collect_windows_info_fallback(info: Dict[str, Any]) -> None:
+        """Fill Windows fields by parsing systeminfo/wmic output (legacy path)"""
+        try:
+            result = subprocess.run(['systeminfo'], capture_output=True, text=True, timeout=10)
+            if result.returncode == 0:
+                for match in _SYSTEMINFO_RE.finditer(result.stdout):
+                    info[_SYSTEMINFO_KEYS[match.group(1)]] = match.group(2).strip()
+        except:
+            pass
+        
+        # Get detailed CPU information
+        try:
+            result = subprocess.run(['wmic', 'cpu', 'get', 'name,cores,threads'], 
+                                  capture_output=True, text=True, timeout=10)
+            if result.returncode == 0:
+                lines = result.stdout.strip().split('\n')
+                if len(lines) >= 2:
+                    parts = lines[1].split()
+                    if len(parts) >= 3:
+                        cpu_name = ' '.join(parts[:-2])
+                        cores = parts[-2]
+                        threads = parts[-1]
+                        info["CPU_Name"] = cpu_name
+                        info["CPU_Cores"] = cores
+                        info["CPU_Threads"] = threads
+        except:
+            pass
+        
+        # Get GPU information using multiple methods
+        gpu_found = False
+        
+        # Method 1: Using WMIC
+        try:
+            result = subprocess.run(['wmic', 'path', 'win32_videocontroller', 'get', 'name,adapterram'], 
+                                  capture_output=True, text=True, timeout=10)
+            if result.returncode == 0:
+                lines = result.stdout.strip().split('\n')
+                gpu_list = []
+                for line in lines[1:]:
+                    if line.strip():
+                        parts = line.rsplit(None, 1)
+                        if len(parts) >= 1:
+                            gpu_name = parts[0].strip()
+                            if gpu_name:
+                                if len(parts) > 1:
+                                    try:
+                                        vram = int(parts[1]) / (1024**3)
+                                        gpu_list.append(f"{gpu_name} ({vram:.2f} GB)")
+                                    except:
+                                        gpu_list.append(gpu_name)
+                                else:
+                                    gpu_list.append(gpu_name)
+                
+                if gpu_list:
+                    info["GPU"] = "; ".join(gpu_list)
+                    gpu_found = True
+        except:
+            pass
+        
+        # Method 2: Using dxdiag if WMIC fails
+        if not gpu_found:
+            try:
+                result = subprocess.run(['wmic', 'logicaldisk', 'get', 'name,size'], 
+                                      capture_output=True, text=True, timeout=10)
+                # Just a fallback, actual GPU detection via registry or other means
+            except:
+                pass
+        
+        if not gpu_found:
+            info["GPU"] = "Detection in progress... Check Device Manager for graphics cards"
+
     @staticmethod
     def get_system_info() -> Dict[str, Any]:
         """Get detailed system information including CPU, GPU, RAM, and Disk"""
-        import platform
-        import socket
-        import re
-        
         try:
             info = {}
             
@@ -946,92 +1549,15 @@ class SystemController:
             # Get detailed Windows information
             if platform.system() == "Windows":
                 try:
-                    result = subprocess.run(['systeminfo'], capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        lines = result.stdout.split('\n')
-                        
-                        for line in lines:
-                            if 'OS Name:' in line:
-                                info["OS_Name"] = line.split(':', 1)[1].strip()
-                            elif 'OS Version:' in line:
-                                info["OS_Version"] = line.split(':', 1)[1].strip()
-                            elif 'System Boot Time:' in line:
-                                info["Boot_Time"] = line.split(':', 1)[1].strip()
-                            elif 'Total Physical Memory:' in line:
-                                info["Total_RAM"] = line.split(':', 1)[1].strip()
-                            elif 'Available Physical Memory:' in line:
-                                info["Available_RAM"] = line.split(':', 1)[1].strip()
-                            elif 'Processor(s):' in line:
-                                info["Processor_Count"] = line.split(':', 1)[1].strip()
-                            elif 'System Type:' in line:
-                                info["System_Type"] = line.split(':', 1)[1].strip()
-                except:
-                    pass
-                
-                # Get detailed CPU information
-                try:
-                    result = subprocess.run(['wmic', 'cpu', 'get', 'name,cores,threads'], 
-                                          capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        lines = result.stdout.strip().split('\n')
-                        if len(lines) >= 2:
-                            parts = lines[1].split()
-                            if len(parts) >= 3:
-                                cpu_name = ' '.join(parts[:-2])
-                                cores = parts[-2]
-                                threads = parts[-1]
-                                info["CPU_Name"] = cpu_name
-                                info["CPU_Cores"] = cores
-                                info["CPU_Threads"] = threads
-                except:
-                    pass
-                
-                # Get GPU information using multiple methods
-                gpu_found = False
-                
-                # Method 1: Using WMIC
-                try:
-                    result = subprocess.run(['wmic', 'path', 'win32_videocontroller', 'get', 'name,adapterram'], 
-                                          capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        lines = result.stdout.strip().split('\n')
-                        gpu_list = []
-                        for line in lines[1:]:
-                            if line.strip():
-                                parts = line.rsplit(None, 1)
-                                if len(parts) >= 1:
-                                    gpu_name = parts[0].strip()
-                                    if gpu_name:
-                                        if len(parts) > 1:
-                                            try:
-                                                vram = int(parts[1]) / (1024**3)
-                                                gpu_list.append(f"{gpu_name} ({vram:.2f} GB)")
-                                            except:
-                                                gpu_list.append(gpu_name)
-                                        else:
-                                            gpu_list.append(gpu_name)
-                        
-                        if gpu_list:
-                            info["GPU"] = "; ".join(gpu_list)
-                            gpu_found = True
-                except:
-                    pass
-                
-                # Method 2: Using dxdiag if WMIC fails
-                if not gpu_found:
-                    try:
-                        result = subprocess.run(['wmic', 'logicaldisk', 'get', 'name,size'], 
-                                              capture_output=True, text=True, timeout=10)
-                        # Just a fallback, actual GPU detection via registry or other means
-                    except:
-                        pass
-                
-                if not gpu_found:
-                    info["GPU"] = "Detection in progress... Check Device Manager for graphics cards"
-            
+                    SystemController._collect_windows_info_wmi(info)
+                except Exception:
+                    # Stale or unavailable COM connection - drop the cached
+                    # handle and fall back to the subprocess collectors
+                    SystemController._wmi_service = None
+                    SystemController._collect_windows_info_fallback(info)
+
             # Get disk information
             try:
-                import shutil
                 disk_usage = shutil.disk_usage("C:\\")
                 total_gb = disk_usage.total / (1024**3)
                 used_gb = disk_usage.used / (1024**3)
@@ -1047,3 +1573,47 @@ class SystemController:
             return info
         except Exception as e:
             return {"error": str(e)}
+
+    # System info cache, split by volatility: hardware/OS identity never
+    # changes within a session and is collected once per process, while the
+    # genuinely dynamic figures (available RAM, disk usage) are cheap direct
+    # queries re-sampled at most once per ttl
+    _sysinfo_static = None
+    _sysinfo_dyn = (0.0, None)
+
+    @staticmethod
+    def _collect_dynamic_info() -> Dict[str, Any]:
+        """Collect just the fields that change while the system runs"""
+        info = {}
+        try:
+            info["Available_RAM"] = f"{_memory_status()[1] // (1024 * 1024):,} MB"
+        except Exception:
+            pass
+        try:
+            disk_usage = shutil.disk_usage("C:\\")
+            total_gb = disk_usage.total / (1024**3)
+            used_gb = disk_usage.used / (1024**3)
+            free_gb = disk_usage.free / (1024**3)
+            used_percent = (disk_usage.used / disk_usage.total) * 100
+            info["Total_Disk"] = f"{total_gb:.2f} GB"
+            info["Used_Disk"] = f"{used_gb:.2f} GB ({used_percent:.1f}%)"
+            info["Free_Disk"] = f"{free_gb:.2f} GB"
+        except Exception:
+            pass
+        return info
+
+    @staticmethod
+    def get_system_info_cached(ttl: float = 2.0) -> Dict[str, Any]:
+        """Get system information without re-running the static collectors
+
+        The full get_system_info sweep happens once per process; after that
+        only the dynamic figures are refreshed, at most once per ttl seconds.
+        """
+        if SystemController._sysinfo_static is None:
+            SystemController._sysinfo_static = SystemController.get_system_info()
+        now = time.monotonic()
+        ts, dyn = SystemController._sysinfo_dyn
+        if dyn is None or now - ts >= ttl:
+            dyn = SystemController._collect_dynamic_info()
+            SystemController._sysinfo_dyn = (now, dyn)
+        return {**SystemController._sysinfo_static, **dyn}
@@ -3,8 +3,14 @@ Tool Caller - Advanced tool calling with retry logic and error handling
 Handles function execution with retry mechanisms and comprehensive error management
 """
 
+import asyncio
+import functools
 import json
 import logging
+import time
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, Callable, List
 from dataclasses import dataclass, asdict
 from datetime import datetime
@@ -64,13 +70,33 @@ class ToolCaller:
             function_executor: FunctionExecutor instance for executing functions
         """
         self.function_executor = function_executor
-        self.call_history: List[ToolCall] = []
+        # Bounded history: old entries fall off the left in O(1), so a
+        # long-running session cannot grow memory without limit
+        self.call_history: deque = deque(maxlen=1000)
         self.retry_config = {
             "max_attempts": 3,
             "backoff_factor": 1.5,
             "timeout": 30
         }
+        # Worker pool for parallel batches; threads are started on demand,
+        # so an idle ToolCaller costs nothing extra
+        self._pool = ThreadPoolExecutor(max_workers=8)
+        # Running tallies kept in step with call_history so get_statistics
+        # is O(1) instead of re-scanning the whole history per call
+        self._total_calls = 0
+        self._status_counts: Dict[CallStatus, int] = {}
+        self._attempts_total = 0
+        self._functions = set()
     
+    def _record_call(self, tool_call: ToolCall):
+        """Append a finished call to the history and update the tallies"""
+        self.call_history.append(tool_call)
+        self._total_calls += 1
+        self._status_counts[tool_call.status] = \
+            self._status_counts.get(tool_call.status, 0) + 1
+        self._attempts_total += tool_call.attempts
+        self._functions.add(tool_call.function)
+
     def execute_tool(
         self,
         function: str,
@@ -90,7 +116,6 @@ class ToolCaller:
         Returns:
             ToolCallResult with execution details
         """
-        import time
         
         if max_attempts is None:
             max_attempts = self.retry_config["max_attempts"]
@@ -104,7 +129,9 @@ class ToolCaller:
             max_attempts=max_attempts
         )
         
-        start_time = time.time()
+        # perf_counter is monotonic - wall-clock NTP jumps can't produce
+        # negative or wildly wrong execution times
+        start_time = time.perf_counter()
         
         while tool_call.attempts < max_attempts:
             tool_call.attempts += 1
@@ -115,19 +142,19 @@ class ToolCaller:
                 
                 # Execute function
                 if self.function_executor:
-                    result = self.function_executor.execute_function({
-                        "function": function,
-                        **params
-                    })
+                    # Positional form avoids re-merging params into a new
+                    # dict on every attempt; also keeps a params key named
+                    # "function" from shadowing the dispatch name
+                    result = self.function_executor.execute_call(function, params)
                 else:
                     result = self._execute_directly(function, params)
                 
-                execution_time = (time.time() - start_time) * 1000
+                execution_time = (time.perf_counter() - start_time) * 1000
                 
                 tool_call.status = CallStatus.SUCCESS
                 tool_call.result = result
                 
-                self.call_history.append(tool_call)
+                self._record_call(tool_call)
                 
                 logger.info(f"✓ {function} succeeded in {execution_time:.0f}ms")
                 
@@ -169,8 +196,8 @@ class ToolCaller:
                 time.sleep(wait_time)
         
         # Final failure
-        execution_time = (time.time() - start_time) * 1000
-        self.call_history.append(tool_call)
+        execution_time = (time.perf_counter() - start_time) * 1000
+        self._record_call(tool_call)
         
         logger.error(f"✗ {function} failed after {tool_call.attempts} attempts: {tool_call.error}")
         
@@ -206,13 +233,20 @@ class ToolCaller:
         Returns:
             List of ToolCallResult
         """
-        results = []
-        
         if parallel:
-            # For now, sequential execution
-            # TODO: Implement parallel execution with threading
-            logger.warning("Parallel execution not yet implemented, using sequential")
+            # Fan out over the worker pool; futures are collected in
+            # submission order, so results still line up with the input
+            futures = [
+                self._pool.submit(
+                    self.execute_tool,
+                    tool["function"],
+                    tool.get("params", {})
+                )
+                for tool in tools
+            ]
+            return [future.result() for future in futures]
         
+        results = []
         for tool in tools:
             result = self.execute_tool(
                 tool["function"],
@@ -221,10 +255,57 @@ class ToolCaller:
             results.append(result)
         
         return results
+
+    async def aexecute_tool(
+        self,
+        function: str,
+        params: Dict[str, Any],
+        max_attempts: int = None,
+        timeout: int = None
+    ) -> ToolCallResult:
+        """Async twin of execute_tool; runs it on the instance's worker
+        pool so the subprocess waits and retry backoff never block the
+        event loop. run_in_executor is used rather than asyncio.to_thread,
+        which is Python 3.9+ while the project supports 3.8."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self._pool,
+            functools.partial(self.execute_tool, function, params,
+                              max_attempts, timeout)
+        )
+
+    async def abatch_execute(
+        self,
+        tools: List[Dict[str, Any]],
+        parallel: bool = True
+    ) -> List[ToolCallResult]:
+        """Async twin of batch_execute
+
+        With parallel=True the calls run concurrently via asyncio.gather,
+        so a batch finishes in roughly the time of its slowest tool
+        instead of the sum of all of them.
+        """
+        if parallel:
+            return list(await asyncio.gather(*(
+                self.aexecute_tool(t["function"], t.get("params", {}))
+                for t in tools
+            )))
+        return [
+            await self.aexecute_tool(t["function"], t.get("params", {}))
+            for t in tools
+        ]
     
     def get_call_history(self, limit: int = None) -> List[Dict[str, Any]]:
         """Get execution history"""
-        history = [
+        # Select the tail first so only the requested entries get
+        # serialized, not the whole history
+        if limit:
+            calls = islice(self.call_history,
+                           max(len(self.call_history) - limit, 0), None)
+        else:
+            calls = self.call_history
+        
+        return [
             {
                 "function": call.function,
                 "params": call.params,
@@ -234,35 +315,34 @@ class ToolCaller:
                 "error": call.error,
                 "result": call.result
             }
-            for call in self.call_history
+            for call in calls
         ]
-        
-        if limit:
-            history = history[-limit:]
-        
-        return history
     
     def clear_history(self):
         """Clear call history"""
         self.call_history.clear()
+        self._total_calls = 0
+        self._status_counts.clear()
+        self._attempts_total = 0
+        self._functions.clear()
         logger.info("Call history cleared")
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get execution statistics"""
-        if not self.call_history:
+        total = self._total_calls
+        if not total:
             return {"total": 0}
         
-        successful = sum(1 for call in self.call_history if call.status == CallStatus.SUCCESS)
-        failed = sum(1 for call in self.call_history if call.status == CallStatus.FAILED)
-        avg_attempts = sum(call.attempts for call in self.call_history) / len(self.call_history)
+        successful = self._status_counts.get(CallStatus.SUCCESS, 0)
+        failed = self._status_counts.get(CallStatus.FAILED, 0)
         
         return {
-            "total": len(self.call_history),
+            "total": total,
             "successful": successful,
             "failed": failed,
-            "success_rate": successful / len(self.call_history) if self.call_history else 0,
-            "avg_attempts": avg_attempts,
-            "functions": list(set(call.function for call in self.call_history))
+            "success_rate": successful / total,
+            "avg_attempts": self._attempts_total / total,
+            "functions": list(self._functions)
         }
     
     def set_retry_config(self, max_attempts: int = None, backoff_factor: float = None, timeout: int = None):